@@ -16,7 +16,7 @@ from fastapi.responses import Response, RedirectResponse, HTMLResponse
 
 from backend.models.analytics_models import TrackingPixelParams, TrackingClickParams
 from backend.services.analytics_service import AnalyticsService
-from backend.services.tracking_service import TrackingService
+from backend.services.tracking_service import tracking_service
 from backend.database import get_supabase_client
 
 router = APIRouter()
@@ -56,7 +56,6 @@ async def track_email_open(
     """
     try:
         # Decode parameters
-        tracking_service = TrackingService()
         params = tracking_service.decode_tracking_params(encoded_params)
 
         # Extract parameters
@@ -125,7 +124,6 @@ async def track_link_click(
     """
     try:
         # Decode parameters
-        tracking_service = TrackingService()
         params = tracking_service.decode_tracking_params(encoded_params)
 
         # Extract parameters
@@ -195,7 +193,6 @@ async def unsubscribe_page(encoded_params: str):
     """
     try:
         # Decode parameters
-        tracking_service = TrackingService()
         params = tracking_service.decode_tracking_params(encoded_params)
 
         workspace_id = params["w"]
@@ -272,7 +269,6 @@ async def process_unsubscribe(encoded_params: str):
     """
     try:
         # Decode parameters
-        tracking_service = TrackingService()
         params = tracking_service.decode_tracking_params(encoded_params)
 
         workspace_id = UUID(params["w"])
@@ -17,7 +17,7 @@ from backend.models.scheduler import (
 )
 from backend.models.responses import APIResponse
 from backend.middleware.auth import get_current_user
-from backend.services.scheduler_service import scheduler_service
+from backend.services.scheduler_service import SchedulerService, get_scheduler_service
 
 router = APIRouter()
 
@@ -29,7 +29,8 @@ router = APIRouter()
 @router.post("", response_model=APIResponse, status_code=status.HTTP_201_CREATED)
 async def create_scheduler_job(
     request: SchedulerJobCreate,
-    user_id: str = Depends(get_current_user)
+    user_id: str = Depends(get_current_user),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service)
 ):
     """
     Create a new scheduled job.
@@ -56,7 +57,8 @@ async def create_scheduler_job(
 @router.get("/workspaces/{workspace_id}", response_model=APIResponse)
 async def list_scheduler_jobs(
     workspace_id: str,
-    user_id: str = Depends(get_current_user)
+    user_id: str = Depends(get_current_user),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service)
 ):
     """
     List all scheduled jobs for a workspace.
@@ -87,7 +89,8 @@ async def list_scheduler_jobs(
 @router.get("/{job_id}", response_model=APIResponse)
 async def get_scheduler_job(
     job_id: str,
-    user_id: str = Depends(get_current_user)
+    user_id: str = Depends(get_current_user),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service)
 ):
     """
     Get scheduler job details.
@@ -115,7 +118,8 @@ async def get_scheduler_job(
 async def update_scheduler_job(
     job_id: str,
     request: SchedulerJobUpdate,
-    user_id: str = Depends(get_current_user)
+    user_id: str = Depends(get_current_user),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service)
 ):
     """
     Update an existing scheduled job.
@@ -142,7 +146,8 @@ async def update_scheduler_job(
 @router.delete("/{job_id}", response_model=APIResponse)
 async def delete_scheduler_job(
     job_id: str,
-    user_id: str = Depends(get_current_user)
+    user_id: str = Depends(get_current_user),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service)
 ):
     """
     Delete a scheduled job.
@@ -175,7 +180,8 @@ async def delete_scheduler_job(
 @router.post("/{job_id}/pause", response_model=APIResponse)
 async def pause_scheduler_job(
     job_id: str,
-    user_id: str = Depends(get_current_user)
+    user_id: str = Depends(get_current_user),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service)
 ):
     """
     Pause a scheduled job.
@@ -201,7 +207,8 @@ async def pause_scheduler_job(
 @router.post("/{job_id}/resume", response_model=APIResponse)
 async def resume_scheduler_job(
     job_id: str,
-    user_id: str = Depends(get_current_user)
+    user_id: str = Depends(get_current_user),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service)
 ):
     """
     Resume a paused job.
@@ -228,7 +235,8 @@ async def resume_scheduler_job(
 async def run_job_now(
     job_id: str,
     request: RunJobNowRequest,
-    user_id: str = Depends(get_current_user)
+    user_id: str = Depends(get_current_user),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service)
 ):
     """
     Trigger immediate job execution.
@@ -266,7 +274,8 @@ async def run_job_now(
 async def get_job_execution_history(
     job_id: str,
     limit: int = 50,
-    user_id: str = Depends(get_current_user)
+    user_id: str = Depends(get_current_user),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service)
 ):
     """
     Get execution history for a job.
@@ -302,7 +311,8 @@ async def get_job_execution_history(
 async def get_workspace_activities(
     workspace_id: str,
     limit: int = 10,
-    user_id: str = Depends(get_current_user)
+    user_id: str = Depends(get_current_user),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service)
 ):
     """
     Get recent activities for workspace dashboard.
@@ -339,7 +349,8 @@ async def get_workspace_activities(
 @router.get("/{job_id}/stats", response_model=APIResponse)
 async def get_job_execution_stats(
     job_id: str,
-    user_id: str = Depends(get_current_user)
+    user_id: str = Depends(get_current_user),
+    scheduler_service: SchedulerService = Depends(get_scheduler_service)
 ):
     """
     Get execution statistics for a job.
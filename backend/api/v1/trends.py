@@ -4,6 +4,7 @@ Trends API Endpoints
 Endpoints for detecting and managing content trends.
 """
 
+from functools import lru_cache
 from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from uuid import UUID
@@ -25,8 +26,14 @@ from backend.api.v1.auth import verify_workspace_access
 router = APIRouter()
 
 
+@lru_cache(maxsize=1)
 def get_trend_service() -> TrendDetectionService:
-    """Dependency: Get trend detection service."""
+    """
+    Dependency: Get trend detection service.
+
+    Shared across requests so the spaCy model, vectorizer and Supabase
+    clients are built once. The service keeps no per-request state.
+    """
     return TrendDetectionService()
 
 
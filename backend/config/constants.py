@@ -48,14 +48,32 @@ class TrendConstants:
     MIN_ITEMS_FOR_DETECTION: int = int(os.getenv("TREND_MIN_ITEMS", "5"))
 
     # TF-IDF parameters
-    TFIDF_MAX_FEATURES: int = int(os.getenv("TFIDF_MAX_FEATURES", "100"))
+    TFIDF_MAX_FEATURES: int = int(os.getenv("TFIDF_MAX_FEATURES", "100"))  # Keyword candidates (most frequent terms)
     TFIDF_MIN_DF: int = int(os.getenv("TFIDF_MIN_DF", "2"))
     TFIDF_NGRAM_RANGE: tuple = (1, 3)  # unigrams, bigrams, trigrams
 
+    # Hashing vectorizer (fit-free clustering features - no vocabulary pass per run)
+    HASHING_N_FEATURES: int = int(os.getenv("TREND_HASHING_N_FEATURES", "1024"))
+    LSA_N_COMPONENTS: int = int(os.getenv("TREND_LSA_N_COMPONENTS", "10"))  # Dense SVD dims the hashed features are clustered in
+
     # Clustering parameters
     MIN_CLUSTER_SIZE: int = int(os.getenv("MIN_CLUSTER_SIZE", "2"))
     MAX_CLUSTERS: int = int(os.getenv("MAX_CLUSTERS", "10"))
     MIN_CLUSTERS: int = int(os.getenv("MIN_CLUSTERS", "3"))
+    # Agglomerative clustering builds an O(n^2) distance matrix; larger corpora use
+    # MiniBatchKMeans (keep below MAX_CONTENT_ITEMS_TO_ANALYZE or that branch never runs)
+    AGGLOMERATIVE_MAX_ITEMS: int = int(os.getenv("TREND_AGGLOMERATIVE_MAX_ITEMS", "200"))
+    KMEANS_N_INIT: int = int(os.getenv("KMEANS_N_INIT", "3"))
+    KMEANS_BATCH_SIZE: int = int(os.getenv("KMEANS_BATCH_SIZE", "256"))  # MiniBatchKMeans rows per step
+
+    # Named entity recognition (spaCy)
+    NER_BATCH_SIZE: int = int(os.getenv("TREND_NER_BATCH_SIZE", "64"))  # Texts per nlp.pipe batch
+    NER_CACHE_SIZE: int = int(os.getenv("TREND_NER_CACHE_SIZE", "20000"))  # Texts whose entities are kept
+    # Worker processes for large batches. Keep 1 (in-process) in the API server: detection runs
+    # in a thread of a multithreaded process, where forking can deadlock. Opt in (>1) only in a
+    # dedicated process that runs detection outside uvicorn.
+    NER_N_PROCESS: int = int(os.getenv("TREND_NER_N_PROCESS", "1"))
+    NER_PARALLEL_MIN_TEXTS: int = int(os.getenv("TREND_NER_PARALLEL_MIN_TEXTS", "200"))  # Smaller batches skip worker startup
 
     # Scoring weights (velocity-first for breaking news)
     MENTION_SCORE_WEIGHT: float = 0.2      # Reduced from 0.3
@@ -88,6 +106,16 @@ class SchedulerConstants:
     # Execution history
     DEFAULT_EXECUTION_HISTORY_LIMIT: int = int(os.getenv("SCHEDULER_HISTORY_LIMIT", "10"))
 
+    # Run-now dispatch queue (optional Redis - worker falls back to the DB reaper without it)
+    REDIS_URL: Optional[str] = os.getenv("REDIS_URL")
+    RUN_NOW_QUEUE_KEY: str = os.getenv("SCHEDULER_RUN_NOW_QUEUE", "scheduler:pending")
+    RUN_NOW_QUEUE_BLOCK_SECONDS: int = int(os.getenv("SCHEDULER_QUEUE_BLOCK_SECONDS", "30"))
+
+    # Reaper: pick up run-now executions the queue never delivered (Redis outage / no Redis)
+    RUN_NOW_REAPER_INTERVAL_SECONDS: int = int(os.getenv("SCHEDULER_REAPER_INTERVAL", "60"))
+    RUN_NOW_REAPER_GRACE_SECONDS: int = int(os.getenv("SCHEDULER_REAPER_GRACE", "60"))
+    RUN_NOW_REAPER_MAX_AGE_SECONDS: int = int(os.getenv("SCHEDULER_REAPER_MAX_AGE", "3600"))  # Never replay stale rows
+
 
 class ContentConstants:
     """Constants for content service."""
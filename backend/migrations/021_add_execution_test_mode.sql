@@ -0,0 +1,57 @@
+-- =====================================================
+-- Migration 021: Add test_mode column and 'queued' status to scheduler_executions
+-- Purpose: Let the worker pick up "run now" executions without losing test mode
+-- Date: 2025-01-27
+-- =====================================================
+--
+-- BACKGROUND:
+-- "Run now" executions are pushed onto a Redis list (scheduler:pending) for
+-- immediate pickup by the worker. If Redis is unavailable (or not configured),
+-- the worker's reaper re-dispatches pending rows straight from this table, so
+-- the test_mode flag has to live on the execution row too.
+-- Run-now executions are inserted as 'queued' (not 'running', which the reaper
+-- could not tell apart from in-flight runs), and a worker claims one with a
+-- conditional UPDATE (status 'queued' -> 'running') before executing it, so
+-- each execution runs at most once across worker replicas.
+--
+-- CHANGES:
+-- - Adds test_mode BOOLEAN column (default false)
+-- - Replaces the status CHECK constraint to allow 'queued' (and
+--   'completed', which the worker already writes)
+-- - Adds partial index for the reaper's queued-executions lookup
+-- - Refreshes Supabase schema cache
+--
+-- SAFETY:
+-- - Idempotent (IF NOT EXISTS / DROP ... IF EXISTS before re-creating)
+-- - No data loss
+-- - Apply BEFORE deploying the backend/worker that inserts 'queued'
+--   executions with test_mode, otherwise run-now inserts fail
+-- =====================================================
+
+-- Add test_mode column
+ALTER TABLE scheduler_executions
+    ADD COLUMN IF NOT EXISTS test_mode BOOLEAN NOT NULL DEFAULT false;
+
+-- Allow the queued status
+ALTER TABLE scheduler_executions
+    DROP CONSTRAINT IF EXISTS scheduler_executions_status_check;
+
+ALTER TABLE scheduler_executions
+    ADD CONSTRAINT scheduler_executions_status_check
+    CHECK (status IN ('queued', 'running', 'completed', 'success', 'failed', 'partial'));
+
+-- Index for reaper query
+-- Pattern: SELECT * FROM scheduler_executions WHERE status = 'queued' AND started_at BETWEEN ? AND ?;
+CREATE INDEX IF NOT EXISTS idx_scheduler_executions_pending
+ON scheduler_executions(started_at)
+WHERE status = 'queued';
+
+-- Add comments for documentation
+COMMENT ON COLUMN scheduler_executions.test_mode IS 'Run-now test mode (skip sending emails). Read by worker.py when dispatching queued executions';
+COMMENT ON COLUMN scheduler_executions.status IS 'queued (run-now, not yet claimed by a worker), running, completed, failed, partial';
+
+-- Refresh Supabase PostgREST schema cache
+NOTIFY pgrst, 'reload schema';
+
+-- Success message
+SELECT 'SUCCESS: Added test_mode column and queued status to scheduler_executions table!' AS result;
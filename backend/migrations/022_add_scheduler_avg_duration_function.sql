@@ -0,0 +1,50 @@
+-- =====================================================
+-- Migration 022: Add get_scheduler_avg_duration function
+-- Purpose: Compute average execution duration in SQL for job stats
+-- Date: 2025-01-27
+-- =====================================================
+--
+-- BACKGROUND:
+-- SchedulerService.get_execution_stats used to load the last N execution
+-- rows (full JSONB results included) and average duration_seconds in Python.
+-- This function returns the average directly from the database.
+--
+-- CHANGES:
+-- - Adds get_scheduler_avg_duration(job_uuid, limit_count) function
+-- - EXECUTE is granted to service_role only; search_path is pinned
+--
+-- SAFETY:
+-- - CREATE OR REPLACE (idempotent, safe to run multiple times)
+-- - Read-only function, no data changes
+-- - Backend falls back to the Python calculation if the function is missing
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION get_scheduler_avg_duration(
+    job_uuid UUID,
+    limit_count INTEGER DEFAULT 10
+)
+RETURNS DOUBLE PRECISION AS $$
+    -- Average over the most recent executions; NULL/0 durations are ignored
+    SELECT AVG(NULLIF(recent.duration_seconds, 0))::DOUBLE PRECISION
+    FROM (
+        SELECT e.duration_seconds
+        FROM scheduler_executions e
+        WHERE e.job_id = job_uuid
+        ORDER BY e.started_at DESC
+        LIMIT limit_count
+    ) AS recent;
+$$ LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public;
+
+COMMENT ON FUNCTION get_scheduler_avg_duration IS 'Average duration_seconds of the last N executions of a job (used by scheduler stats endpoint)';
+
+-- Only the backend's service-role client may call this: the function has no
+-- access check of its own, so anon/authenticated callers must not reach it through /rpc
+REVOKE EXECUTE ON FUNCTION get_scheduler_avg_duration(UUID, INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION get_scheduler_avg_duration(UUID, INTEGER) TO service_role;
+
+-- Refresh Supabase PostgREST schema cache
+NOTIFY pgrst, 'reload schema';
+
+-- Success message
+SELECT 'SUCCESS: Added get_scheduler_avg_duration function!' AS result;
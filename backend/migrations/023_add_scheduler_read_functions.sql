@@ -0,0 +1,100 @@
+-- =====================================================
+-- Migration 023: Add scheduler read functions with embedded access checks
+-- Purpose: Serve hot scheduler read paths through plan-cached SQL functions
+-- Date: 2025-01-27
+-- =====================================================
+--
+-- BACKGROUND:
+-- The scheduler dashboard polls job lists, execution history and the
+-- activity feed. Each call used to do a separate user_workspaces membership
+-- query followed by a PostgREST table query. These functions join the
+-- membership check into the same statement, and their plans are cached by
+-- Postgres across calls.
+--
+-- CHANGES:
+-- - list_jobs_for_user(p_user_id, p_workspace_id)
+-- - list_executions_for_user(p_user_id, p_job_id, p_limit)
+-- - list_workspace_activities(p_user_id, p_workspace_id, p_limit)
+--   All return no rows when the user is not a member of the workspace.
+-- - EXECUTE is granted to service_role only; search_path is pinned
+--
+-- SAFETY:
+-- - CREATE OR REPLACE (idempotent, safe to run multiple times)
+-- - Read-only functions, no data changes
+-- - Backend falls back to the previous queries if the functions are missing
+-- =====================================================
+
+-- Function: Jobs for a workspace the user belongs to
+CREATE OR REPLACE FUNCTION list_jobs_for_user(
+    p_user_id UUID,
+    p_workspace_id UUID
+)
+RETURNS SETOF scheduler_jobs AS $$
+    SELECT j.*
+    FROM scheduler_jobs j
+    WHERE j.workspace_id = p_workspace_id
+        AND EXISTS (
+            SELECT 1 FROM user_workspaces uw
+            WHERE uw.user_id = p_user_id
+                AND uw.workspace_id = p_workspace_id
+        )
+    ORDER BY j.created_at DESC;
+$$ LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public;
+
+-- Function: Execution history for a job in a workspace the user belongs to
+CREATE OR REPLACE FUNCTION list_executions_for_user(
+    p_user_id UUID,
+    p_job_id UUID,
+    p_limit INTEGER DEFAULT 10
+)
+RETURNS SETOF scheduler_executions AS $$
+    SELECT e.*
+    FROM scheduler_executions e
+    JOIN user_workspaces uw
+        ON uw.workspace_id = e.workspace_id
+        AND uw.user_id = p_user_id
+    WHERE e.job_id = p_job_id
+    ORDER BY e.started_at DESC
+    LIMIT p_limit;
+$$ LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public;
+
+-- Function: Recent executions across a workspace (dashboard activity feed)
+CREATE OR REPLACE FUNCTION list_workspace_activities(
+    p_user_id UUID,
+    p_workspace_id UUID,
+    p_limit INTEGER DEFAULT 10
+)
+RETURNS SETOF scheduler_executions AS $$
+    SELECT e.*
+    FROM scheduler_executions e
+    WHERE e.workspace_id = p_workspace_id
+        AND EXISTS (
+            SELECT 1 FROM user_workspaces uw
+            WHERE uw.user_id = p_user_id
+                AND uw.workspace_id = p_workspace_id
+        )
+    ORDER BY e.started_at DESC
+    LIMIT p_limit;
+$$ LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public;
+
+COMMENT ON FUNCTION list_jobs_for_user IS 'Scheduler jobs for a workspace, empty if user is not a member';
+COMMENT ON FUNCTION list_executions_for_user IS 'Execution history for a job, empty if user is not a member of its workspace';
+COMMENT ON FUNCTION list_workspace_activities IS 'Recent executions for the dashboard activity feed, empty if user is not a member';
+
+-- Only the backend's service-role client may call these: the functions trust
+-- p_user_id, so anon/authenticated callers must not reach them through /rpc
+REVOKE EXECUTE ON FUNCTION list_jobs_for_user(UUID, UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION list_jobs_for_user(UUID, UUID) TO service_role;
+REVOKE EXECUTE ON FUNCTION list_executions_for_user(UUID, UUID, INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION list_executions_for_user(UUID, UUID, INTEGER) TO service_role;
+REVOKE EXECUTE ON FUNCTION list_workspace_activities(UUID, UUID, INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION list_workspace_activities(UUID, UUID, INTEGER) TO service_role;
+
+-- Refresh Supabase PostgREST schema cache
+NOTIFY pgrst, 'reload schema';
+
+-- Success message
+SELECT 'SUCCESS: Added scheduler read functions!' AS result;
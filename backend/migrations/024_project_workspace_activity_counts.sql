@@ -0,0 +1,72 @@
+-- =====================================================
+-- Migration 024: Return only activity-feed scalars from list_workspace_activities
+-- Purpose: Stop shipping full scrape_result/send_result JSONB to the dashboard
+-- Date: 2025-01-27
+-- =====================================================
+--
+-- BACKGROUND:
+-- The activity feed only needs three counters from each execution's JSONB
+-- results (items scraped, number of sources, recipients). Returning the
+-- whole documents meant transferring and JSON-decoding every blob just to
+-- read those numbers.
+--
+-- CHANGES:
+-- - Redefines list_workspace_activities (from migration 023) to return
+--   id, status, started_at, actions_performed, items_count, sources_count,
+--   recipients_count
+-- - Re-applies 023's service_role-only EXECUTE grant (DROP resets it)
+--
+-- SAFETY:
+-- - Return type changes, so the function is dropped and recreated
+-- - Read-only function, no data changes
+-- - Backend falls back to a projected table query if the function is missing
+-- =====================================================
+
+DROP FUNCTION IF EXISTS list_workspace_activities(UUID, UUID, INTEGER);
+
+CREATE OR REPLACE FUNCTION list_workspace_activities(
+    p_user_id UUID,
+    p_workspace_id UUID,
+    p_limit INTEGER DEFAULT 10
+)
+RETURNS TABLE (
+    id UUID,
+    status TEXT,
+    started_at TIMESTAMPTZ,
+    actions_performed TEXT[],
+    items_count INTEGER,
+    sources_count INTEGER,
+    recipients_count INTEGER
+) AS $$
+    SELECT
+        e.id,
+        e.status,
+        e.started_at,
+        e.actions_performed,
+        COALESCE((e.scrape_result->>'items_count')::INTEGER, 0) AS items_count,
+        COALESCE(jsonb_array_length(e.scrape_result->'sources'), 0) AS sources_count,
+        COALESCE((e.send_result->>'recipients_count')::INTEGER, 0) AS recipients_count
+    FROM scheduler_executions e
+    WHERE e.workspace_id = p_workspace_id
+        AND EXISTS (
+            SELECT 1 FROM user_workspaces uw
+            WHERE uw.user_id = p_user_id
+                AND uw.workspace_id = p_workspace_id
+        )
+    ORDER BY e.started_at DESC
+    LIMIT p_limit;
+$$ LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public;
+
+COMMENT ON FUNCTION list_workspace_activities IS 'Recent executions (scalar counters only) for the dashboard activity feed, empty if user is not a member';
+
+-- Only the backend's service-role client may call this: the function trusts
+-- p_user_id, so anon/authenticated callers must not reach it through /rpc
+REVOKE EXECUTE ON FUNCTION list_workspace_activities(UUID, UUID, INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION list_workspace_activities(UUID, UUID, INTEGER) TO service_role;
+
+-- Refresh Supabase PostgREST schema cache
+NOTIFY pgrst, 'reload schema';
+
+-- Success message
+SELECT 'SUCCESS: list_workspace_activities now returns activity counters only!' AS result;
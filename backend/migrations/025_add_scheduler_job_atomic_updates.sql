@@ -0,0 +1,106 @@
+-- =====================================================
+-- Migration 025: Atomic, access-checked scheduler job updates
+-- Purpose: Replace read-then-write in pause/resume/update with one UPDATE
+-- Date: 2025-01-27
+-- =====================================================
+--
+-- BACKGROUND:
+-- pause_job/resume_job/update_job used to read the job (access check) and
+-- then write it in a second round trip. Rapid pause/resume toggles could
+-- interleave between the two. These functions do the membership check and
+-- the write in a single UPDATE ... RETURNING statement. No row comes back
+-- when the job doesn't exist or the user is not a workspace member.
+--
+-- CHANGES:
+-- - Adds pause_scheduler_job(p_user_id, p_job_id)
+-- - Adds resume_scheduler_job(p_user_id, p_job_id)
+-- - Adds update_scheduler_job_for_user(p_user_id, p_job_id, p_updates JSONB)
+-- - EXECUTE is granted to service_role only; search_path is pinned
+--
+-- SAFETY:
+-- - CREATE OR REPLACE (idempotent, safe to run multiple times)
+-- - No schema changes
+-- - Backend falls back to read-then-write if the functions are missing
+-- =====================================================
+
+-- Function: Pause job (membership check + write in one statement)
+CREATE OR REPLACE FUNCTION pause_scheduler_job(
+    p_user_id UUID,
+    p_job_id UUID
+)
+RETURNS SETOF scheduler_jobs AS $$
+    UPDATE scheduler_jobs j
+    SET status = 'paused',
+        is_enabled = false
+    WHERE j.id = p_job_id
+        AND j.workspace_id IN (
+            SELECT uw.workspace_id FROM user_workspaces uw
+            WHERE uw.user_id = p_user_id
+        )
+    RETURNING j.*;
+$$ LANGUAGE sql VOLATILE SECURITY DEFINER
+SET search_path = public;
+
+-- Function: Resume job (membership check + write in one statement)
+CREATE OR REPLACE FUNCTION resume_scheduler_job(
+    p_user_id UUID,
+    p_job_id UUID
+)
+RETURNS SETOF scheduler_jobs AS $$
+    UPDATE scheduler_jobs j
+    SET status = 'active',
+        is_enabled = true
+    WHERE j.id = p_job_id
+        AND j.workspace_id IN (
+            SELECT uw.workspace_id FROM user_workspaces uw
+            WHERE uw.user_id = p_user_id
+        )
+    RETURNING j.*;
+$$ LANGUAGE sql VOLATILE SECURITY DEFINER
+SET search_path = public;
+
+-- Function: Partial job update (only keys present in p_updates are written)
+CREATE OR REPLACE FUNCTION update_scheduler_job_for_user(
+    p_user_id UUID,
+    p_job_id UUID,
+    p_updates JSONB
+)
+RETURNS SETOF scheduler_jobs AS $$
+    UPDATE scheduler_jobs j
+    SET name = CASE WHEN p_updates ? 'name' THEN u.name ELSE j.name END,
+        schedule_type = CASE WHEN p_updates ? 'schedule_type' THEN u.schedule_type ELSE j.schedule_type END,
+        schedule_time = CASE WHEN p_updates ? 'schedule_time' THEN u.schedule_time ELSE j.schedule_time END,
+        schedule_days = CASE WHEN p_updates ? 'schedule_days' THEN u.schedule_days ELSE j.schedule_days END,
+        cron_expression = CASE WHEN p_updates ? 'cron_expression' THEN u.cron_expression ELSE j.cron_expression END,
+        timezone = CASE WHEN p_updates ? 'timezone' THEN u.timezone ELSE j.timezone END,
+        actions = CASE WHEN p_updates ? 'actions' THEN u.actions ELSE j.actions END,
+        status = CASE WHEN p_updates ? 'status' THEN u.status ELSE j.status END,
+        is_enabled = CASE WHEN p_updates ? 'is_enabled' THEN u.is_enabled ELSE j.is_enabled END
+    FROM jsonb_populate_record(NULL::scheduler_jobs, p_updates) AS u
+    WHERE j.id = p_job_id
+        AND j.workspace_id IN (
+            SELECT uw.workspace_id FROM user_workspaces uw
+            WHERE uw.user_id = p_user_id
+        )
+    RETURNING j.*;
+$$ LANGUAGE sql VOLATILE SECURITY DEFINER
+SET search_path = public;
+
+COMMENT ON FUNCTION pause_scheduler_job IS 'Pause job if user is a workspace member; returns no row otherwise';
+COMMENT ON FUNCTION resume_scheduler_job IS 'Resume job if user is a workspace member; returns no row otherwise';
+COMMENT ON FUNCTION update_scheduler_job_for_user IS 'Partially update job if user is a workspace member; returns no row otherwise';
+
+-- Only the backend's service-role client may call these: the functions trust
+-- p_user_id, so anon/authenticated callers must not reach them through /rpc
+REVOKE EXECUTE ON FUNCTION pause_scheduler_job(UUID, UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION pause_scheduler_job(UUID, UUID) TO service_role;
+REVOKE EXECUTE ON FUNCTION resume_scheduler_job(UUID, UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION resume_scheduler_job(UUID, UUID) TO service_role;
+REVOKE EXECUTE ON FUNCTION update_scheduler_job_for_user(UUID, UUID, JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION update_scheduler_job_for_user(UUID, UUID, JSONB) TO service_role;
+
+-- Refresh Supabase PostgREST schema cache
+NOTIFY pgrst, 'reload schema';
+
+-- Success message
+SELECT 'SUCCESS: Added atomic scheduler job update functions!' AS result;
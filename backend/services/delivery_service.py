@@ -14,7 +14,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 from ai_newsletter.database.supabase_client import SupabaseManager
 from ai_newsletter.delivery.email_sender import EmailSender
 from ai_newsletter.config.settings import get_settings
-from backend.services.tracking_service import TrackingService
+from backend.services.tracking_service import tracking_service
 from backend.services.analytics_service import AnalyticsService
 
 
@@ -25,7 +25,6 @@ class DeliveryService:
         """Initialize delivery service."""
         self._db = None
         self._email_sender = None
-        self._tracking_service = None
         self._analytics_service = None
 
     @property
@@ -45,10 +44,8 @@ class DeliveryService:
 
     @property
     def tracking_service(self):
-        """Lazy-load TrackingService."""
-        if self._tracking_service is None:
-            self._tracking_service = TrackingService()
-        return self._tracking_service
+        """Shared TrackingService instance."""
+        return tracking_service
 
     @property
     def analytics_service(self):
@@ -126,6 +123,13 @@ class DeliveryService:
             failed_count = 0
             errors = []
 
+            # UTM-tagged links are the same for every subscriber; build them once
+            link_map = self.tracking_service.precompute_link_map(
+                html_content=newsletter['content_html'],
+                newsletter_id=newsletter_id,
+                content_items=newsletter.get('content_items', [])
+            )
+
             for i, subscriber in enumerate(subscribers, 1):
                 try:
                     print(f"\n📨 Sending to subscriber {i}/{len(subscribers)}: {subscriber['email']}")
@@ -137,7 +141,7 @@ class DeliveryService:
                         newsletter_id=newsletter_id,
                         recipient_email=subscriber['email'],
                         workspace_id=workspace_id,
-                        content_items=newsletter.get('content_items', [])
+                        link_map=link_map
                     )
 
                     # Add unsubscribe link (CAN-SPAM compliance)
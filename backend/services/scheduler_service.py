@@ -8,8 +8,17 @@ This service handles:
 - Job statistics
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from datetime import datetime, timezone
+from functools import lru_cache
+import asyncio
+import json
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    # redis not installed - run-now executions are picked up by the worker's DB reaper
+    aioredis = None
 
 from backend.models.scheduler import (
     SchedulerJobCreate,
@@ -23,12 +32,114 @@ from backend.utils.error_handling import handle_service_errors, NotFoundError
 from backend.config.constants import SchedulerConstants
 
 
+# Fields a job update may touch (computed once instead of dumping the model per call)
+_UPDATE_FIELDS = frozenset(SchedulerJobUpdate.model_fields)
+
+# Fields the list endpoints expose (rows are projected onto the response models' shape)
+_JOB_FIELDS = tuple(SchedulerJobResponse.model_fields)
+_EXECUTION_FIELDS = tuple(SchedulerExecutionResponse.model_fields)
+
+
+# Execution status -> activity-feed status
+_STATUS_MAP = {
+    'completed': 'success',
+    'queued': 'pending',
+    'running': 'pending',
+    'failed': 'pending',
+    'partial': 'success'
+}
+
+# Execution action -> activity-feed title
+_TITLE_BY_ACTION = {
+    'scrape': 'Content Scraped',
+    'generate': 'Newsletter Generated',
+    'send': 'Newsletter Sent'
+}
+
+
+def _utcnow_iso() -> str:
+    """Current UTC time as a timezone-aware ISO string (replaces deprecated utcnow())."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+# Activity-feed (title, description) per execution action.
+# Counters are projected out of the JSONB results by the database
+# (see list_workspace_activities).
+
+def _scrape_activity(execution: Dict[str, Any]) -> Tuple[str, str]:
+    return (
+        _TITLE_BY_ACTION['scrape'],
+        f"{execution['items_count']} new items from {execution['sources_count']} sources"
+    )
+
+
+def _generate_activity(execution: Dict[str, Any]) -> Tuple[str, str]:
+    return _TITLE_BY_ACTION['generate'], 'Draft ready for review'
+
+
+def _send_activity(execution: Dict[str, Any]) -> Tuple[str, str]:
+    return _TITLE_BY_ACTION['send'], f"Delivered to {execution['recipients_count']} subscribers"
+
+
+def _unknown_activity(execution: Dict[str, Any]) -> Tuple[None, None]:
+    return None, None
+
+
+_ACTION_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Tuple[Optional[str], Optional[str]]]] = {
+    'scrape': _scrape_activity,
+    'generate': _generate_activity,
+    'send': _send_activity
+}
+
+
 class SchedulerService(BaseService):
     """Service for managing scheduled jobs."""
 
     def __init__(self, db=None):
         """Initialize scheduler service with dependency injection."""
         super().__init__(db)
+        self._redis = None
+
+    @property
+    def redis(self):
+        """
+        Get Redis client for the run-now queue.
+
+        Uses lazy loading; returns None when REDIS_URL is not configured
+        or the redis package is not installed.
+        """
+        if self._redis is None and aioredis is not None and SchedulerConstants.REDIS_URL:
+            self._redis = aioredis.from_url(SchedulerConstants.REDIS_URL)
+        return self._redis
+
+    async def _enqueue_execution(self, execution_id: str, job_id: str, test_mode: bool) -> bool:
+        """
+        Push a run-now execution onto the worker queue.
+
+        Args:
+            execution_id: Execution record ID
+            job_id: Job ID to execute
+            test_mode: If True, worker skips sending emails
+
+        Returns:
+            True if queued, False if Redis is unavailable (worker reaper picks it up)
+        """
+        if self.redis is None:
+            return False
+
+        try:
+            await self.redis.lpush(
+                SchedulerConstants.RUN_NOW_QUEUE_KEY,
+                json.dumps({
+                    'execution_id': execution_id,
+                    'job_id': job_id,
+                    'test_mode': test_mode
+                })
+            )
+            return True
+        except Exception as e:
+            self.logger.warning(f"Failed to queue execution {execution_id}, worker reaper will pick it up: {e}")
+            return False
 
     @handle_service_errors(default_return=None, raise_on_error=True)
     async def create_job(self, user_id: str, request: SchedulerJobCreate) -> SchedulerJobResponse:
@@ -82,7 +193,7 @@ class SchedulerService(BaseService):
         return SchedulerJobResponse(**job)
 
     @handle_service_errors(default_return=[], raise_on_error=False)
-    async def list_jobs(self, user_id: str, workspace_id: str) -> List[SchedulerJobResponse]:
+    async def list_jobs(self, user_id: str, workspace_id: str) -> List[Dict[str, Any]]:
         """
         List all jobs for a workspace.
 
@@ -91,16 +202,15 @@ class SchedulerService(BaseService):
             workspace_id: Workspace ID to filter jobs
 
         Returns:
-            List of SchedulerJobResponse objects (empty list on error)
+            List of job dicts with the SchedulerJobResponse fields (empty list on error)
         """
         self.logger.info(f"Listing jobs for workspace {workspace_id}")
-        # Verify user has access to workspace
-        if not self.db.user_has_workspace_access(user_id, workspace_id):
-            raise NotFoundError(f"Access denied: User not in workspace")
-
-        jobs = self.db.list_scheduler_jobs(workspace_id)
+        # Workspace membership is enforced inside the database function
+        jobs = self.db.list_scheduler_jobs_for_user(user_id, workspace_id)
         self.logger.info(f"Found {len(jobs)} jobs for workspace {workspace_id}")
-        return [SchedulerJobResponse(**job) for job in jobs]
+        # Rows come straight from the typed scheduler_jobs table and are only
+        # serialized back to JSON, so return plain dicts instead of re-validating
+        return [{field: job.get(field) for field in _JOB_FIELDS} for job in jobs]
 
     @handle_service_errors(default_return=None, raise_on_error=True)
     async def get_job(self, user_id: str, job_id: str) -> SchedulerJobResponse:
@@ -122,11 +232,9 @@ class SchedulerService(BaseService):
             raise NotFoundError(f"Job {job_id} not found")
 
         # Verify user has access to this workspace
-        workspace = self.db.get_workspace(job['workspace_id'])
+        # (membership implies the workspace exists, so no separate lookup)
         if not self.db.user_has_workspace_access(user_id, job['workspace_id']):
             raise NotFoundError(f"Access denied: User not in workspace")
-        if not workspace:
-            raise NotFoundError("Access denied")
 
         return SchedulerJobResponse(**job)
 
@@ -151,17 +259,17 @@ class SchedulerService(BaseService):
         Raises:
             NotFoundError: If job not found or access denied
         """
-        # Get existing job (validates access)
-        job = await self.get_job(user_id, job_id)
-
-        # Prepare updates (only include non-None fields)
-        updates = {}
-        for field, value in request.model_dump(exclude_unset=True).items():
-            if value is not None:
-                updates[field] = value
+        # Prepare updates (only explicitly set, non-None fields; skips model_dump's deep copy)
+        updates = {
+            field: value
+            for field in request.model_fields_set & _UPDATE_FIELDS
+            if (value := getattr(request, field)) is not None
+        }
 
-        # Update job
-        updated_job = self.db.update_scheduler_job(job_id, updates)
+        # Update job (access check and write happen in one statement)
+        updated_job = self.db.update_scheduler_job_for_user(user_id, job_id, updates)
+        if not updated_job:
+            raise NotFoundError(f"Job {job_id} not found or access denied")
 
         return SchedulerJobResponse(**updated_job)
 
@@ -200,15 +308,10 @@ class SchedulerService(BaseService):
         Returns:
             SchedulerJobResponse with updated job details
         """
-        # Verify access
-        await self.get_job(user_id, job_id)
-
-        # Pause job
-        updates = {
-            "status": "paused",
-            "is_enabled": False
-        }
-        updated_job = self.db.update_scheduler_job(job_id, updates)
+        # Pause job (access check and write happen in one statement)
+        updated_job = self.db.pause_scheduler_job_for_user(user_id, job_id)
+        if not updated_job:
+            raise NotFoundError(f"Job {job_id} not found or access denied")
 
         return SchedulerJobResponse(**updated_job)
 
@@ -224,15 +327,10 @@ class SchedulerService(BaseService):
         Returns:
             SchedulerJobResponse with updated job details
         """
-        # Verify access
-        await self.get_job(user_id, job_id)
-
-        # Resume job
-        updates = {
-            "status": "active",
-            "is_enabled": True
-        }
-        updated_job = self.db.update_scheduler_job(job_id, updates)
+        # Resume job (access check and write happen in one statement)
+        updated_job = self.db.resume_scheduler_job_for_user(user_id, job_id)
+        if not updated_job:
+            raise NotFoundError(f"Job {job_id} not found or access denied")
 
         return SchedulerJobResponse(**updated_job)
 
@@ -259,19 +357,23 @@ class SchedulerService(BaseService):
         # Get job details
         job = await self.get_job(user_id, job_id)
 
-        # Create execution record
+        # Create execution record. 'queued' until a worker claims it (requires
+        # migration 021 for test_mode and the queued status)
         execution_data = {
             "job_id": job_id,
-            "workspace_id": job['workspace_id'],
-            "status": "running",
+            "workspace_id": job.workspace_id,
+            "status": "queued",
             "actions_performed": [],
-            "started_at": datetime.utcnow().isoformat()
+            "test_mode": test_mode,
+            "started_at": _utcnow_iso()
         }
-        execution = self.db.create_scheduler_execution(execution_data)
+        # Blocking PostgREST call: keep it off the event loop
+        execution = await asyncio.to_thread(self.db.create_scheduler_execution, execution_data)
 
-        # TODO: Queue job for background worker
-        # For now, we just create the execution record
-        # The background worker will pick it up and execute it
+        # Hand off to the background worker (Redis queue, no polling delay).
+        # If Redis is down or not configured, the worker's reaper picks up
+        # the pending execution record from the database instead.
+        await self._enqueue_execution(execution['id'], job_id, test_mode)
 
         return {
             "execution_id": execution['id'],
@@ -286,7 +388,7 @@ class SchedulerService(BaseService):
         user_id: str,
         job_id: str,
         limit: int = None
-    ) -> List[SchedulerExecutionResponse]:
+    ) -> List[Dict[str, Any]]:
         """
         Get execution history for a job.
 
@@ -296,18 +398,21 @@ class SchedulerService(BaseService):
             limit: Maximum number of executions to return (default from constants)
 
         Returns:
-            List of SchedulerExecutionResponse objects ordered by started_at DESC
+            List of execution dicts with the SchedulerExecutionResponse fields,
+            ordered by started_at DESC
         """
         if limit is None:
             limit = SchedulerConstants.DEFAULT_EXECUTION_HISTORY_LIMIT
 
-        # Verify access
-        await self.get_job(user_id, job_id)
-
-        # Get execution history
-        executions = self.db.get_scheduler_executions(job_id, limit)
+        # Get execution history (workspace membership enforced by the database function)
+        executions = self.db.get_scheduler_executions_for_user(user_id, job_id, limit)
 
-        return [SchedulerExecutionResponse(**execution) for execution in executions]
+        # Rows come straight from the typed scheduler_executions table and are only
+        # serialized back to JSON, so return plain dicts instead of re-validating
+        return [
+            {field: execution.get(field) for field in _EXECUTION_FIELDS}
+            for execution in executions
+        ]
 
     @handle_service_errors(default_return=None, raise_on_error=True)
     async def get_execution_stats(
@@ -334,13 +439,8 @@ class SchedulerService(BaseService):
         failed = job.failed_runs or 0
         success_rate = (successful / total * 100) if total > 0 else 0
 
-        # Get recent executions for avg duration
-        executions = await self.get_execution_history(user_id, job_id, limit=10)
-        avg_duration = None
-        if executions:
-            durations = [e.duration_seconds for e in executions if e.duration_seconds]
-            if durations:
-                avg_duration = sum(durations) / len(durations)
+        # Average duration of recent executions (computed in SQL)
+        avg_duration = self.db.get_scheduler_avg_duration(job_id, limit=10)
 
         stats = SchedulerExecutionStats(
             total_executions=total,
@@ -381,76 +481,55 @@ class SchedulerService(BaseService):
         """
         self.logger.info(f"Fetching recent activities for workspace {workspace_id}")
 
-        # Verify workspace access
+        # Verify workspace access (also guards the next-scheduled-job lookup below)
         if not self.db.user_has_workspace_access(user_id, workspace_id):
             raise NotFoundError(f"Access denied: User not in workspace")
 
         # Get recent executions
-        executions = self.db.get_workspace_recent_executions(workspace_id, limit=limit)
+        executions = self.db.get_workspace_activities_for_user(user_id, workspace_id, limit=limit)
 
         # Transform executions to activities
         activities = []
         for execution in executions:
             actions = execution.get('actions_performed', [])
-            status_map = {
-                'completed': 'success',
-                'running': 'pending',
-                'failed': 'pending',
-                'partial': 'success'
-            }
-
-            # Create activity for each action performed
+
+            # Shared by every activity of this execution
+            execution_id = execution['id']
+            status = _STATUS_MAP.get(execution.get('status', 'pending'), 'success')
+            timestamp = execution.get('started_at')
+
+            # Create activity for each action performed (built in one dict literal)
             for action in actions:
-                activity = {
-                    'id': f"{execution['id']}-{action}",
+                title, description = _ACTION_HANDLERS.get(action, _unknown_activity)(execution)
+                activities.append({
+                    'id': f"{execution_id}-{action}",
                     'type': action,
-                    'status': status_map.get(execution.get('status', 'pending'), 'success'),
-                    'timestamp': execution.get('started_at'),
-                }
-
-                # Action-specific titles and descriptions
-                if action == 'scrape':
-                    scrape_result = execution.get('scrape_result', {})
-                    items_count = scrape_result.get('items_count', 0)
-                    sources = scrape_result.get('sources', [])
-                    sources_count = len(sources)  # Calculate count from array
-                    activity['title'] = 'Content Scraped'
-                    activity['description'] = f'{items_count} new items from {sources_count} sources'
-
-                elif action == 'generate':
-                    activity['title'] = 'Newsletter Generated'
-                    activity['description'] = 'Draft ready for review'
-
-                elif action == 'send':
-                    send_result = execution.get('send_result', {})
-                    recipients = send_result.get('recipients_count', 0)
-                    activity['title'] = 'Newsletter Sent'
-                    activity['description'] = f'Delivered to {recipients} subscribers'
-
-                activities.append(activity)
+                    'status': status,
+                    'timestamp': timestamp,
+                    'title': title,
+                    'description': description
+                })
 
         # Add next scheduled job as first activity
-        jobs = await self.list_jobs(user_id, workspace_id)
-        active_jobs = [j for j in jobs if j.is_enabled and j.next_run_at]
-        if active_jobs:
-            next_job = min(active_jobs, key=lambda j: j.next_run_at)
-            # next_job.next_run_at is already a datetime object (from SchedulerJobResponse model)
-            next_run = next_job.next_run_at
+        # (database returns only the earliest enabled job via ORDER BY ... LIMIT 1)
+        next_job = self.db.get_next_scheduled_job(workspace_id)
+        if next_job:
+            next_run = datetime.fromisoformat(next_job['next_run_at'].replace('Z', '+00:00'))
             time_until = next_run - datetime.now(timezone.utc)
             hours = int(time_until.total_seconds() / 3600)
 
             if hours < 24:
-                time_desc = f"Tomorrow at {next_job.schedule_time}" if hours > 12 else f"in {hours}h"
+                time_desc = f"Tomorrow at {next_job['schedule_time']}" if hours > 12 else f"in {hours}h"
             else:
                 days = int(hours / 24)
                 time_desc = f"in {days}d"
 
             activities.insert(0, {
-                'id': f'schedule-{next_job.id}',
+                'id': f"schedule-{next_job['id']}",
                 'type': 'schedule',
                 'title': 'Next Newsletter Scheduled',
                 'description': time_desc,
-                'timestamp': next_job.next_run_at,
+                'timestamp': next_run,
                 'status': 'scheduled'
             })
 
@@ -458,5 +537,12 @@ class SchedulerService(BaseService):
         return activities[:limit]
 
 
-# Singleton instance
-scheduler_service = SchedulerService()
+@lru_cache(maxsize=1)
+def get_scheduler_service() -> SchedulerService:
+    """
+    Dependency: Get the shared scheduler service.
+
+    Created on first use rather than at import time, then reused so the
+    Redis connection pool is shared.
+    """
+    return SchedulerService()
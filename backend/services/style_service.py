@@ -7,13 +7,13 @@ style-specific prompts for AI newsletter generation.
 
 import re
 import json
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple, FrozenSet
 from collections import Counter
+from functools import lru_cache
 from uuid import UUID
 import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
+import numpy as np
 from nltk.corpus import stopwords
-import textstat
 from backend.models.style_profile import (
     StyleProfileCreate,
     StyleProfileResponse,
@@ -23,33 +23,94 @@ from backend.models.style_profile import (
 )
 from backend.services.base_service import BaseService
 from backend.utils.error_handling import handle_service_errors
-from src.ai_newsletter.database.supabase_client import SupabaseManager
 
 
-# Download required NLTK data on first import
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt', quiet=True)
-    nltk.download('punkt_tab', quiet=True)
+@lru_cache(maxsize=1)
+def _english_stopwords() -> FrozenSet[str]:
+    """
+    English stopwords, loaded once per process on first use.
 
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords', quiet=True)
+    Downloads the NLTK corpus if it is missing. Loading lazily keeps a
+    missing corpus from breaking the app import (newsletter_service builds
+    a StyleAnalysisService at import); a failed load is not cached, so the
+    next call retries.
+    """
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        nltk.download('stopwords', quiet=True)
+    return frozenset(stopwords.words('english'))
+
+
+# Lightweight tokenizers (replace NLTK Punkt - only sentence/word boundaries are needed)
+# Sentence boundary: terminal punctuation (plus closing quotes/brackets) followed by whitespace
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])["\')\]]*\s+|\n{2,}')
+# Word token: word characters with inner apostrophes (don't, it's), or a single punctuation mark
+_WORD_RE = re.compile(r"\w+(?:['\u2019]\w+)*|[^\w\s]")
+
+
+def _split_sentences(text: str) -> List[str]:
+    """Split text into sentences."""
+    return [sent.strip() for sent in _SENTENCE_SPLIT_RE.split(text) if sent and not sent.isspace()]
+
+
+def _tokenize_words(text: str) -> List[str]:
+    """Split text into word and punctuation tokens."""
+    return _WORD_RE.findall(text)
+
+
+# Common phrase patterns, merged into one alternation so the text is scanned once
+_PHRASE_RE = re.compile(
+    r"here'?s? (?:the|a) \w+"
+    r"|let'?s? \w+ \w+"
+    r"|(?:you|we) (?:can|could|should|must) \w+"
+    r"|\w+ \w+ (?:is|are) \w+"
+    r"|in (?:this|the) \w+"
+)
+
+# Tone / structure indicators
+_EMOJI_RE = re.compile('[\U0001F300-\U0001FAFF\u2600-\u27BF]')
+_PERSONAL_PRONOUNS = frozenset({'i', 'you', 'we', 'my', 'your', 'our'})
+_TRANSITION_WORDS = frozenset({'however', 'moreover', 'furthermore', 'meanwhile', 'now', 'but', 'yet'})
+_SECTION_HEADER_RE = re.compile(r'^#{1,3}\s', re.MULTILINE)
+
+
+def _scan_structure(sample: str) -> Tuple[int, int, int]:
+    """Count (sections, emojis, chars) in a sample."""
+    # Sections: blank-line breaks plus #/##/### headers
+    sections = sample.count('\n\n') + len(_SECTION_HEADER_RE.findall(sample))
+    return sections, len(_EMOJI_RE.findall(sample)), len(sample)
+
+
+# Syllable estimate: count vowel groups (drop a trailing silent 'e')
+_VOWEL_GROUP_RE = re.compile(r'[aeiouy]+')
+
+
+def _count_syllables_fast(word: str) -> int:
+    """Estimate syllables in a lowercase word."""
+    count = len(_VOWEL_GROUP_RE.findall(word))
+    if count > 1 and word.endswith('e') and not word.endswith(('le', 'ee')):
+        count -= 1
+    return max(1, count)
+
+
+# Analyzer names accepted by StyleAnalysisService.analyze_samples(fields=...)
+STYLE_ANALYZERS = frozenset({'sentences', 'vocabulary', 'tone', 'structure', 'examples'})
 
 
 class StyleAnalysisService(BaseService):
     """Service for analyzing writing style from newsletter samples."""
 
-    def __init__(self, db: Optional[SupabaseManager] = None):
-        super().__init__(db)
-        self.stopwords = set(stopwords.words('english'))
+    @property
+    def stopwords(self) -> FrozenSet[str]:
+        """English stopwords (loaded on first use, shared by every instance)."""
+        return _english_stopwords()
 
     def analyze_samples(
         self,
         samples: List[str],
-        workspace_id: UUID
+        workspace_id: UUID,
+        fields: Optional[Set[str]] = None
     ) -> Tuple[StyleProfileCreate, Dict[str, Any]]:
         """
         Analyze newsletter samples to extract writing style.
@@ -57,60 +118,103 @@ class StyleAnalysisService(BaseService):
         Args:
             samples: List of newsletter text samples
             workspace_id: Workspace to associate profile with
+            fields: Analyzers to run (subset of STYLE_ANALYZERS); all by default.
+                Profile fields owned by skipped analyzers keep their schema defaults.
 
         Returns:
             Tuple of (StyleProfileCreate, analysis_summary)
+
+        Raises:
+            ValueError: If fields contains an unknown analyzer name
         """
+        fields = STYLE_ANALYZERS if fields is None else frozenset(fields)
+        unknown = fields - STYLE_ANALYZERS
+        if unknown:
+            raise ValueError(f"Unknown style analyzers: {', '.join(sorted(unknown))}")
+
         # Combine all samples
         combined_text = "\n\n".join(samples)
 
+        # Tokenize once; every analyzer works from these (words only if an analyzer needs them)
+        sentences_per_sample = [_split_sentences(sample) for sample in samples]
+        all_sentences = [sent for sample_sentences in sentences_per_sample for sent in sample_sentences]
+        if fields & {'sentences', 'vocabulary', 'tone'}:
+            words_per_sentence = [_tokenize_words(sent) for sent in all_sentences]
+            lower_words = [word.lower() for sent_words in words_per_sentence for word in sent_words]
+
+        profile_fields: Dict[str, Any] = {}
+        summary: Dict[str, Any] = {
+            "samples_analyzed": len(samples),
+            "total_sentences": len(all_sentences)
+        }
+
         # Analyze different aspects
-        sentences = self._analyze_sentences(combined_text)
-        vocabulary = self._analyze_vocabulary(combined_text)
-        tone_info = self._analyze_tone(combined_text)
-        structure = self._analyze_structure(samples)
-        examples = self._extract_examples(samples)
+        if 'sentences' in fields:
+            sentences = self._analyze_sentences(all_sentences, words_per_sentence)
+            profile_fields.update(
+                avg_sentence_length=sentences['avg_length'],
+                sentence_length_variety=sentences['std_dev'],
+                question_frequency=sentences['question_freq']
+            )
+
+        if 'vocabulary' in fields:
+            vocabulary = self._analyze_vocabulary(lower_words, combined_text, len(all_sentences))
+            profile_fields.update(
+                vocabulary_level=vocabulary['level'],
+                favorite_phrases=vocabulary['common_phrases'][:10],
+                avoided_words=vocabulary['rare_words'][:10]
+            )
+            summary.update(
+                total_words=vocabulary['total_words'],
+                avg_words_per_sample=vocabulary['total_words'] / len(samples),
+                readability_score=vocabulary['readability'],
+                unique_words=vocabulary['unique_words']
+            )
+
+        if 'tone' in fields:
+            tone_info = self._analyze_tone(lower_words, combined_text)
+            profile_fields.update(
+                tone=tone_info['tone'],
+                formality_level=tone_info['formality']
+            )
+            summary.update(
+                detected_tone=tone_info['tone'],
+                confidence_score=tone_info['confidence']
+            )
+
+        if 'structure' in fields:
+            structure = self._analyze_structure(samples, sentences_per_sample)
+            profile_fields.update(
+                typical_intro_style=structure['intro_style'],
+                section_count=structure['avg_sections'],
+                uses_emojis=structure['uses_emojis'],
+                emoji_frequency=structure['emoji_freq']
+            )
+
+        if 'examples' in fields:
+            examples = self._extract_examples(sentences_per_sample)
+            profile_fields.update(
+                example_intros=examples['intros'][:3],
+                example_transitions=examples['transitions'][:3],
+                example_conclusions=examples['conclusions'][:3]
+            )
 
         # Build style profile
         profile = StyleProfileCreate(
             workspace_id=workspace_id,
-            tone=tone_info['tone'],
-            formality_level=tone_info['formality'],
-            avg_sentence_length=sentences['avg_length'],
-            sentence_length_variety=sentences['std_dev'],
-            question_frequency=sentences['question_freq'],
-            vocabulary_level=vocabulary['level'],
-            favorite_phrases=vocabulary['common_phrases'][:10],
-            avoided_words=vocabulary['rare_words'][:10],
-            typical_intro_style=structure['intro_style'],
-            section_count=structure['avg_sections'],
-            uses_emojis=structure['uses_emojis'],
-            emoji_frequency=structure['emoji_freq'],
-            example_intros=examples['intros'][:3],
-            example_transitions=examples['transitions'][:3],
-            example_conclusions=examples['conclusions'][:3],
             trained_on_count=len(samples),
-            training_samples=samples
+            training_samples=samples,
+            **profile_fields
         )
 
-        # Build analysis summary
-        summary = {
-            "samples_analyzed": len(samples),
-            "total_words": vocabulary['total_words'],
-            "total_sentences": sentences['total_count'],
-            "avg_words_per_sample": vocabulary['total_words'] / len(samples),
-            "detected_tone": tone_info['tone'],
-            "confidence_score": tone_info['confidence'],
-            "readability_score": vocabulary['readability'],
-            "unique_words": vocabulary['unique_words']
-        }
-
         return profile, summary
 
-    def _analyze_sentences(self, text: str) -> Dict[str, Any]:
+    def _analyze_sentences(
+        self,
+        sentences: List[str],
+        words_per_sentence: List[List[str]]
+    ) -> Dict[str, Any]:
         """Analyze sentence-level patterns."""
-        sentences = sent_tokenize(text)
-
         if not sentences:
             return {
                 'total_count': 0,
@@ -119,20 +223,17 @@ class StyleAnalysisService(BaseService):
                 'question_freq': 0.0
             }
 
-        # Calculate sentence lengths
-        lengths = []
-        question_count = 0
-
-        for sent in sentences:
-            words = word_tokenize(sent)
-            lengths.append(len(words))
-
-            if '?' in sent:
-                question_count += 1
+        # Calculate sentence lengths (mean / population std in NumPy)
+        lengths = np.fromiter(
+            (len(words) for words in words_per_sentence),
+            dtype=np.int32,
+            count=len(words_per_sentence)
+        )
+        question_count = sum(1 for sent in sentences if '?' in sent)
 
-        avg_length = sum(lengths) / len(lengths) if lengths else 15.0
-        std_dev = (sum((x - avg_length) ** 2 for x in lengths) / len(lengths)) ** 0.5 if len(lengths) > 1 else 5.0
-        question_freq = question_count / len(sentences) if sentences else 0.0
+        avg_length = float(lengths.mean())
+        std_dev = float(lengths.std()) if len(lengths) > 1 else 5.0
+        question_freq = question_count / len(sentences)
 
         return {
             'total_count': len(sentences),
@@ -141,10 +242,14 @@ class StyleAnalysisService(BaseService):
             'question_freq': round(question_freq, 3)
         }
 
-    def _analyze_vocabulary(self, text: str) -> Dict[str, Any]:
+    def _analyze_vocabulary(
+        self,
+        lower_words: List[str],
+        text: str,
+        sentence_count: int
+    ) -> Dict[str, Any]:
         """Analyze vocabulary patterns."""
-        words = word_tokenize(text.lower())
-        words = [w for w in words if w.isalnum()]
+        words = [w for w in lower_words if w.isalnum()]
 
         if not words:
             return {
@@ -156,15 +261,21 @@ class StyleAnalysisService(BaseService):
                 'readability': 60.0
             }
 
-        # Calculate metrics
-        unique_words = len(set(words))
+        # Calculate metrics (one frequency table serves every count below)
+        word_freq = Counter(words)
+        unique_words = len(word_freq)
         lexical_diversity = unique_words / len(words) if words else 0.5
 
         # Extract common phrases (bigrams and trigrams)
         common_phrases = self._extract_common_phrases(text)
 
-        # Get readability score
-        readability = textstat.flesch_reading_ease(text)
+        # Flesch Reading Ease from counts we already have (only syllables are new)
+        syllables = sum(_count_syllables_fast(word) * count for word, count in word_freq.items())
+        readability = (
+            206.835
+            - 1.015 * (len(words) / max(1, sentence_count))
+            - 84.6 * (syllables / len(words))
+        )
 
         # Determine vocabulary level based on readability
         if readability >= 80:
@@ -175,7 +286,6 @@ class StyleAnalysisService(BaseService):
             level = "advanced"
 
         # Find avoided words (very rare technical terms)
-        word_freq = Counter(words)
         rare_words = [
             word for word, count in word_freq.items()
             if count == 1 and len(word) > 8 and word not in self.stopwords
@@ -193,40 +303,15 @@ class StyleAnalysisService(BaseService):
 
     def _extract_common_phrases(self, text: str) -> List[str]:
         """Extract frequently used phrases (2-3 word combinations)."""
-        # Simple phrase extraction using regex
-        phrases = []
-
-        # Look for common phrase patterns
-        patterns = [
-            r"here'?s? (the|a) \w+",
-            r"let'?s? \w+ \w+",
-            r"(you|we) (can|could|should|must) \w+",
-            r"\w+ \w+ (is|are) \w+",
-            r"in (this|the) \w+"
-        ]
+        # Simple phrase extraction using regex (single pass over the text)
+        phrase_counts = Counter(match.group(0) for match in _PHRASE_RE.finditer(text.lower()))
 
-        text_lower = text.lower()
-        for pattern in patterns:
-            matches = re.findall(pattern, text_lower)
-            phrases.extend([match if isinstance(match, str) else ' '.join(match) for match in matches])
-
-        # Count and return top phrases
-        phrase_counts = Counter(phrases)
+        # Return top phrases
         return [phrase for phrase, _ in phrase_counts.most_common(10)]
 
-    def _analyze_tone(self, text: str) -> Dict[str, Any]:
+    def _analyze_tone(self, lower_words: List[str], text: str) -> Dict[str, Any]:
         """Detect tone and formality."""
-        text_lower = text.lower()
-
-        # Count indicators
-        contractions = len(re.findall(r"\b\w+'\w+\b", text))
-        exclamations = text.count('!')
-        emojis = len(re.findall(r'[😀-🙏🌀-🗿🚀-🛿]', text))
-        personal_pronouns = len(re.findall(r'\b(i|you|we|my|your|our)\b', text_lower))
-
-        # Calculate formality (0.0 = casual, 1.0 = formal)
-        words = word_tokenize(text)
-        word_count = len(words)
+        word_count = len(lower_words)
 
         if word_count == 0:
             return {
@@ -235,9 +320,23 @@ class StyleAnalysisService(BaseService):
                 'confidence': 0.5
             }
 
-        contraction_rate = contractions / word_count if word_count > 0 else 0
-        personal_rate = personal_pronouns / word_count if word_count > 0 else 0
-        exclamation_rate = exclamations / word_count if word_count > 0 else 0
+        # Count indicators: contractions and pronouns in one pass over the shared
+        # tokens (the tokenizer keeps "don't" / "it's" whole), no re-tokenizing
+        contractions = 0
+        personal_pronouns = 0
+        for word in lower_words:
+            if "'" in word or "\u2019" in word:
+                contractions += 1
+            elif word in _PERSONAL_PRONOUNS:
+                personal_pronouns += 1
+
+        exclamations = text.count('!')
+        emojis = len(_EMOJI_RE.findall(text))
+
+        # Calculate formality (0.0 = casual, 1.0 = formal)
+        contraction_rate = contractions / word_count
+        personal_rate = personal_pronouns / word_count
+        exclamation_rate = exclamations / word_count
 
         # Higher = more formal
         formality = 1.0 - (contraction_rate * 2 + personal_rate + exclamation_rate)
@@ -262,7 +361,11 @@ class StyleAnalysisService(BaseService):
             'confidence': round(confidence, 2)
         }
 
-    def _analyze_structure(self, samples: List[str]) -> Dict[str, Any]:
+    def _analyze_structure(
+        self,
+        samples: List[str],
+        sentences_per_sample: List[List[str]]
+    ) -> Dict[str, Any]:
         """Analyze structural patterns."""
         total_sections = 0
         emoji_count = 0
@@ -270,17 +373,14 @@ class StyleAnalysisService(BaseService):
 
         intro_styles = []
 
-        for sample in samples:
-            # Count sections (headers with #, ##, or blank lines)
-            sections = len(re.findall(r'\n\n', sample)) + len(re.findall(r'^#{1,3}\s', sample, re.MULTILINE))
+        for sample, sentences in zip(samples, sentences_per_sample):
+            # Count sections (headers with #, ##, or blank lines) and emojis
+            sections, emojis, chars = _scan_structure(sample)
             total_sections += max(1, sections)
+            emoji_count += emojis
+            total_chars += chars
 
-            # Count emojis
-            emoji_count += len(re.findall(r'[😀-🙏🌀-🗿🚀-🛿]', sample))
-            total_chars += len(sample)
-
-            # Detect intro style (first sentence)
-            sentences = sent_tokenize(sample)
+            # Detect intro style (first sentence, from the shared tokenization)
             if sentences:
                 first = sentences[0].strip()
                 if first.endswith('?'):
@@ -307,17 +407,13 @@ class StyleAnalysisService(BaseService):
             'intro_style': intro_style
         }
 
-    def _extract_examples(self, samples: List[str]) -> Dict[str, List[str]]:
+    def _extract_examples(self, sentences_per_sample: List[List[str]]) -> Dict[str, List[str]]:
         """Extract example sentences for few-shot learning."""
         intros = []
         transitions = []
         conclusions = []
 
-        transition_words = ['however', 'moreover', 'furthermore', 'meanwhile', 'now', 'but', 'yet']
-
-        for sample in samples:
-            sentences = sent_tokenize(sample)
-
+        for sentences in sentences_per_sample:
             if not sentences:
                 continue
 
@@ -329,8 +425,9 @@ class StyleAnalysisService(BaseService):
 
             # Find transitions
             for sent in sentences[1:-1]:  # Skip first and last
-                sent_lower = sent.lower()
-                if any(word in sent_lower.split()[:3] for word in transition_words):
+                # Only the first three words can open with a connective
+                lead = {word.lower().rstrip(',;:') for word in sent.split(None, 3)[:3]}
+                if not lead.isdisjoint(_TRANSITION_WORDS):
                     transitions.append(sent.strip())
 
         return {
@@ -9,22 +9,111 @@ This service handles:
 """
 
 import base64
+import html
 import json
 import re
+from functools import lru_cache
+from json.encoder import encode_basestring as _json_string
 from typing import Dict, List, Optional
-from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+from urllib.parse import urlparse, parse_qs, quote_plus, urlencode, urlunparse
 from uuid import UUID
 
 from bs4 import BeautifulSoup
 
 from backend.settings import settings
 
+try:
+    import orjson  # Optional: C-level JSON for high-volume tracking payloads
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(params: Dict[str, Optional[str]]) -> bytes:
+    """Serialize flat tracking parameters (str or None values) to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(params)
+    # Payloads are flat, so emit them directly (about 2x faster than json.dumps)
+    return (
+        "{" + ",".join(
+            f'"{key}":' + ("null" if value is None else _json_string(value))
+            for key, value in params.items()
+        ) + "}"
+    ).encode()
+
+
+def _json_loads(data: bytes) -> Dict:
+    """Parse tracking parameters from JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _encode_params(params: Dict) -> str:
+    """JSON-serialize and URL-safe base64-encode tracking parameters."""
+    return base64.urlsafe_b64encode(_json_dumps(params)).decode()
+
+
+# Fixed UTM params, pre-encoded for links that have no query string of their own
+_STATIC_UTM_PREFIX = "utm_source=newsletter&utm_medium=email&"
+
+# Upper bound on encoded tracking params accepted from the public endpoints
+# (click payloads carry the destination URL, so leave room for long links)
+_MAX_ENCODED_PARAMS_LENGTH = 8192
+
+
+# Link rewriting works on the raw HTML: only <a href> values change, so no DOM round-trip.
+# Groups: 1 = "<a ... href=", 2 = quote, 3 = quoted value, 4 = unquoted value
+_ANCHOR_HREF_RE = re.compile(
+    r"""(<a\b[^>]*?\shref\s*=\s*)(?:(["'])(.*?)\2|(?!["'])([^\s>]+))""",
+    re.IGNORECASE | re.DOTALL
+)
+_BODY_CLOSE_RE = re.compile(r"</body\s*>", re.IGNORECASE)
+_FOOTER_CLOSE_RE = re.compile(r"</footer\s*>", re.IGNORECASE)
+
+# Per-recipient encodings repeat across a send (pixel + footer + header), so memoize them.
+# Keys are plain strings so UUID and str callers share entries.
+_ENCODE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_ENCODE_CACHE_SIZE)
+def _encode_pixel_params(newsletter_id: str, recipient_email: str, workspace_id: str) -> str:
+    """Base64-encode open-tracking pixel parameters."""
+    # Fixed shape: format directly rather than building a dict for the serializer
+    payload = f'{{"n":{_json_string(newsletter_id)},"r":{_json_string(recipient_email)},"w":{_json_string(workspace_id)}}}'
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+@lru_cache(maxsize=_ENCODE_CACHE_SIZE)
+def _encode_unsubscribe_params(workspace_id: str, recipient_email: str) -> str:
+    """Base64-encode unsubscribe parameters."""
+    payload = f'{{"w":{_json_string(workspace_id)},"e":{_json_string(recipient_email)}}}'
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _href_value(match: re.Match) -> str:
+    """Unescaped href of an _ANCHOR_HREF_RE match (quoted or unquoted attribute)."""
+    return html.unescape(match.group(3) if match.group(2) else match.group(4))
+
+
+def _insert_before_body_close(html_content: str, fragment: str) -> str:
+    """Insert an HTML fragment before the last </body>, or append it if there is none."""
+    matches = list(_BODY_CLOSE_RE.finditer(html_content))
+    if not matches:
+        return html_content + fragment
+    idx = matches[-1].start()
+    return html_content[:idx] + fragment + html_content[idx:]
+
 
 class TrackingService:
     """Service for generating email tracking code."""
 
     def __init__(self):
         self.tracking_domain = settings.backend_url
+        # URL prefixes are fixed per process; build them once
+        self._pixel_prefix = f"{self.tracking_domain}/track/pixel/"
+        self._click_prefix = f"{self.tracking_domain}/track/click/"
+        self._unsubscribe_prefix = f"{self.tracking_domain}/unsubscribe/"
+        self.click_tracking_enabled = settings.enable_click_tracking
 
     def generate_tracking_pixel_url(
         self, newsletter_id: UUID, recipient_email: str, workspace_id: UUID
@@ -40,17 +129,11 @@ class TrackingService:
         Returns:
             URL to 1×1 transparent PNG tracking pixel
         """
-        params = {
-            "n": str(newsletter_id),
-            "r": recipient_email,
-            "w": str(workspace_id),
-        }
-
         # Encode parameters
-        encoded = base64.urlsafe_b64encode(json.dumps(params).encode()).decode()
+        encoded = _encode_pixel_params(str(newsletter_id), recipient_email, str(workspace_id))
 
         # Generate URL
-        return f"{self.tracking_domain}/track/pixel/{encoded}.png"
+        return self._pixel_prefix + encoded + ".png"
 
     def generate_tracked_link(
         self,
@@ -77,22 +160,49 @@ class TrackingService:
         if original_url.startswith(("mailto:", "tel:", "sms:", "#")):
             return original_url
 
+        tracked_url = self._add_utm_parameters(original_url, newsletter_id, content_item_id)
+
+        # Option 1: Direct URL with UTM (simpler, no redirect)
+        # Used when server-side click tracking is disabled
+        if not self.click_tracking_enabled:
+            return tracked_url
+
+        # Option 2: Add redirect tracking (for server-side click recording)
+        return self._build_click_url(
+            tracked_url, newsletter_id, recipient_email, workspace_id, content_item_id
+        )
+
+    def _add_utm_parameters(
+        self,
+        original_url: str,
+        newsletter_id: UUID,
+        content_item_id: Optional[UUID] = None,
+    ) -> str:
+        """Add UTM parameters to a URL (recipient-independent)."""
         parsed = urlparse(original_url)
-        params = parse_qs(parsed.query)
 
-        # Add UTM parameters
-        params.update({
-            "utm_source": ["newsletter"],
-            "utm_medium": ["email"],
-            "utm_campaign": [str(newsletter_id)[:8]],  # Shortened for readability
-        })
+        if not parsed.query:
+            # Common case: nothing to merge, so append the UTM query directly
+            new_query = _STATIC_UTM_PREFIX + "utm_campaign=" + quote_plus(str(newsletter_id)[:8])
+            if content_item_id:
+                new_query += "&utm_content=" + quote_plus(str(content_item_id)[:8])
+        else:
+            params = parse_qs(parsed.query)
+
+            # Add UTM parameters
+            params.update({
+                "utm_source": ["newsletter"],
+                "utm_medium": ["email"],
+                "utm_campaign": [str(newsletter_id)[:8]],  # Shortened for readability
+            })
 
-        if content_item_id:
-            params["utm_content"] = [str(content_item_id)[:8]]
+            if content_item_id:
+                params["utm_content"] = [str(content_item_id)[:8]]
+
+            new_query = urlencode(params, doseq=True)
 
         # Rebuild URL with UTM parameters
-        new_query = urlencode(params, doseq=True)
-        tracked_url = urlunparse((
+        return urlunparse((
             parsed.scheme,
             parsed.netloc,
             parsed.path,
@@ -101,10 +211,15 @@ class TrackingService:
             parsed.fragment,
         ))
 
-        # Option 1: Direct URL with UTM (simpler, no redirect)
-        # Return tracked_url directly if you don't need server-side click tracking
-
-        # Option 2: Add redirect tracking (for server-side click recording)
+    def _build_click_url(
+        self,
+        tracked_url: str,
+        newsletter_id: UUID,
+        recipient_email: str,
+        workspace_id: UUID,
+        content_item_id: Optional[UUID] = None,
+    ) -> str:
+        """Wrap a UTM-tagged URL in the per-recipient click redirect."""
         # Encode tracking data
         track_data = {
             "n": str(newsletter_id),
@@ -114,10 +229,50 @@ class TrackingService:
             "u": tracked_url,  # Original URL with UTM
         }
 
-        encoded_track = base64.urlsafe_b64encode(json.dumps(track_data).encode()).decode()
+        encoded_track = _encode_params(track_data)
 
         # Return redirect URL
-        return f"{self.tracking_domain}/track/click/{encoded_track}"
+        return self._click_prefix + encoded_track
+
+    def precompute_link_map(
+        self,
+        html_content: str,
+        newsletter_id: UUID,
+        content_items: Optional[List[Dict]] = None,
+    ) -> Dict[str, Dict]:
+        """
+        Build the recipient-independent part of link tracking once per newsletter.
+
+        Args:
+            html_content: Original HTML content
+            newsletter_id: Newsletter UUID
+            content_items: List of content items with IDs (optional)
+
+        Returns:
+            Dict of original URL -> {"utm_url": ..., "content_item_id": ...}
+        """
+        # Map URLs to content item IDs for tracking
+        content_item_map = {}
+        if content_items:
+            for item in content_items:
+                if "source_url" in item and "id" in item:
+                    content_item_map[item["source_url"]] = item["id"]
+
+        link_map = {}
+        for match in _ANCHOR_HREF_RE.finditer(html_content):
+            original_url = _href_value(match)
+
+            # Skip special URLs
+            if original_url in link_map or original_url.startswith(("mailto:", "tel:", "sms:", "#")):
+                continue
+
+            content_item_id = content_item_map.get(original_url)
+            link_map[original_url] = {
+                "utm_url": self._add_utm_parameters(original_url, newsletter_id, content_item_id),
+                "content_item_id": content_item_id,
+            }
+
+        return link_map
 
     def add_tracking_to_html(
         self,
@@ -126,6 +281,7 @@ class TrackingService:
         recipient_email: str,
         workspace_id: UUID,
         content_items: Optional[List[Dict]] = None,
+        link_map: Optional[Dict[str, Dict]] = None,
     ) -> str:
         """
         Add tracking pixel and link tracking to email HTML.
@@ -136,68 +292,63 @@ class TrackingService:
             recipient_email: Recipient email address
             workspace_id: Workspace UUID
             content_items: List of content items with IDs (optional)
+            link_map: Output of precompute_link_map for this HTML (optional;
+                pass it when sending the same newsletter to many recipients)
 
         Returns:
             HTML with tracking pixel and tracked links
         """
-        # Parse HTML
-        soup = BeautifulSoup(html_content, "html.parser")
-
-        # 1. Add tracking pixel at the end of body
-        pixel_url = self.generate_tracking_pixel_url(
-            newsletter_id, recipient_email, workspace_id
-        )
-
-        # Create tracking pixel element
-        pixel_img = soup.new_tag(
-            "img",
-            src=pixel_url,
-            width="1",
-            height="1",
-            alt="",
-            style="display:none;",
-        )
-
-        # Insert before closing body tag or at end
-        body = soup.find("body")
-        if body:
-            body.append(pixel_img)
-        else:
-            # If no body tag, append to end
-            soup.append(pixel_img)
+        # 1. Resolve UTM URLs (shared by every recipient of this newsletter)
+        if link_map is None:
+            link_map = self.precompute_link_map(html_content, newsletter_id, content_items)
 
         # 2. Add tracking to all links
-        content_item_map = {}
-        if content_items:
-            # Map URLs to content item IDs for tracking
-            for item in content_items:
-                if "source_url" in item and "id" in item:
-                    content_item_map[item["source_url"]] = item["id"]
+        def track_href(match: re.Match) -> str:
+            link = link_map.get(_href_value(match))
 
-        for link in soup.find_all("a", href=True):
-            original_url = link["href"]
+            # Special URLs are not in the map
+            if link is None:
+                return match.group(0)
 
-            # Skip special URLs
-            if original_url.startswith(("mailto:", "tel:", "sms:", "#")):
-                continue
+            tracked_url = self._resolve_link(link, newsletter_id, recipient_email, workspace_id)
+            # Unquoted hrefs are written back quoted (tracked URLs contain '=')
+            quote = match.group(2) or '"'
+            return f"{match.group(1)}{quote}{html.escape(tracked_url)}{quote}"
 
-            # Find matching content item ID
-            content_item_id = content_item_map.get(original_url)
+        tracked_html = _ANCHOR_HREF_RE.sub(track_href, html_content)
 
-            # Generate tracked URL
-            tracked_url = self.generate_tracked_link(
-                original_url,
-                newsletter_id,
-                recipient_email,
-                workspace_id,
-                content_item_id,
-            )
+        # 3. Add tracking pixel before closing body tag (or at end)
+        return _insert_before_body_close(
+            tracked_html, self._pixel_img(newsletter_id, recipient_email, workspace_id)
+        )
 
-            # Update link
-            link["href"] = tracked_url
+    def _resolve_link(
+        self,
+        link: Dict,
+        newsletter_id: UUID,
+        recipient_email: str,
+        workspace_id: UUID,
+    ) -> str:
+        """Final href for a link_map entry (click redirect, or plain UTM URL if disabled)."""
+        if not self.click_tracking_enabled:
+            return link["utm_url"]
+        return self._build_click_url(
+            link["utm_url"],
+            newsletter_id,
+            recipient_email,
+            workspace_id,
+            link["content_item_id"],
+        )
 
-        # 3. Return modified HTML
-        return str(soup)
+    def _pixel_img(self, newsletter_id: UUID, recipient_email: str, workspace_id: UUID) -> str:
+        """Hidden <img> tag for the open-tracking pixel."""
+        pixel_url = self.generate_tracking_pixel_url(
+            newsletter_id, recipient_email, workspace_id
+        )
+        return (
+            f'<img alt="" height="1" src="{html.escape(pixel_url)}" '
+            f'style="display:none;" width="1"/>'
+        )
 
     def add_unsubscribe_link(
         self, html_content: str, workspace_id: UUID, recipient_email: str
@@ -214,37 +365,27 @@ class TrackingService:
             HTML with unsubscribe link added
         """
         # Generate unsubscribe URL
-        params = {
-            "w": str(workspace_id),
-            "e": recipient_email,
-        }
-        encoded = base64.urlsafe_b64encode(json.dumps(params).encode()).decode()
-        unsubscribe_url = f"{self.tracking_domain}/unsubscribe/{encoded}"
-
-        # Parse HTML
-        soup = BeautifulSoup(html_content, "html.parser")
-
-        # Find footer or create one
-        footer = soup.find("footer")
-        if not footer:
-            footer = soup.new_tag("footer", style="text-align:center; padding:20px; color:#666; font-size:12px;")
-            body = soup.find("body")
-            if body:
-                body.append(footer)
-            else:
-                soup.append(footer)
+        encoded = _encode_unsubscribe_params(str(workspace_id), recipient_email)
+        unsubscribe_url = self._unsubscribe_prefix + encoded
 
-        # Add unsubscribe link
-        unsubscribe_text = soup.new_tag("p")
-        unsubscribe_link = soup.new_tag("a", href=unsubscribe_url, style="color:#666; text-decoration:underline;")
-        unsubscribe_link.string = "Unsubscribe"
-
-        unsubscribe_text.append("Don't want to receive these emails? ")
-        unsubscribe_text.append(unsubscribe_link)
+        unsubscribe_text = (
+            "<p>Don't want to receive these emails? "
+            f'<a href="{html.escape(unsubscribe_url)}" style="color:#666; text-decoration:underline;">'
+            "Unsubscribe</a></p>"
+        )
 
-        footer.append(unsubscribe_text)
+        # Append to an existing footer
+        footer_close = _FOOTER_CLOSE_RE.search(html_content)
+        if footer_close:
+            idx = footer_close.start()
+            return html_content[:idx] + unsubscribe_text + html_content[idx:]
 
-        return str(soup)
+        # Otherwise create one at the end of the body
+        footer = (
+            '<footer style="text-align:center; padding:20px; color:#666; font-size:12px;">'
+            f"{unsubscribe_text}</footer>"
+        )
+        return _insert_before_body_close(html_content, footer)
 
     def decode_tracking_params(self, encoded_params: str) -> Dict:
         """
@@ -255,10 +396,16 @@ class TrackingService:
 
         Returns:
             Decoded parameters dict
+
+        Raises:
+            ValueError: If the params are oversized or malformed
         """
+        if len(encoded_params) > _MAX_ENCODED_PARAMS_LENGTH:
+            raise ValueError("Invalid tracking parameters: payload too large")
+
         try:
-            decoded = base64.urlsafe_b64decode(encoded_params.encode()).decode()
-            params = json.loads(decoded)
+            decoded = base64.urlsafe_b64decode(encoded_params.encode())
+            params = _json_loads(decoded)
             return params
         except Exception as e:
             raise ValueError(f"Invalid tracking parameters: {e}")
@@ -327,11 +474,14 @@ class TrackingService:
             Dict with email headers
         """
         # Generate unsubscribe URL
-        params = {"w": str(workspace_id), "e": recipient_email}
-        encoded = base64.urlsafe_b64encode(json.dumps(params).encode()).decode()
-        unsubscribe_url = f"{self.tracking_domain}/unsubscribe/{encoded}"
+        encoded = _encode_unsubscribe_params(str(workspace_id), recipient_email)
+        unsubscribe_url = self._unsubscribe_prefix + encoded
 
         return {
             "List-Unsubscribe": f"<{unsubscribe_url}>",
             "List-Unsubscribe-Post": "List-Unsubscribe=One-Click",
         }
+
+
+# Global service instance
+tracking_service = TrackingService()
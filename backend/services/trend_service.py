@@ -6,14 +6,24 @@ and cross-source validation.
 """
 
 import re
+import heapq
+import asyncio
+import hashlib
+import threading
+from functools import lru_cache
+from itertools import chain
 from typing import List, Dict, Any, Optional, Tuple
-from collections import Counter, defaultdict
+from collections import Counter, OrderedDict, defaultdict
 from datetime import datetime, timedelta, timezone
-from uuid import UUID, uuid4
+from uuid import UUID
 import numpy as np
 import spacy
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.cluster import KMeans
+from scipy.sparse import csr_matrix, issparse, triu
+from scipy.sparse.csgraph import connected_components
+from sklearn.decomposition import TruncatedSVD
+from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer, TfidfTransformer, TfidfVectorizer
+from sklearn.preprocessing import normalize
+from sklearn.cluster import AgglomerativeClustering, MiniBatchKMeans
 from backend.models.trend import (
     TrendCreate,
     TrendResponse,
@@ -28,25 +38,125 @@ from backend.config.constants import TrendConstants
 from src.ai_newsletter.database.supabase_client import SupabaseManager
 
 
+# spaCy entities keyed by text hash - content items are re-analyzed on every
+# detection run but rarely change between runs
+_entity_cache: "OrderedDict[bytes, List[Tuple[str, str]]]" = OrderedDict()
+_entity_cache_lock = threading.Lock()
+
+_NAT = np.datetime64('NaT', 'us')
+
+# Topic naming tables (built once, not per cluster)
+_ENTITY_LABELS = frozenset({'PRODUCT', 'ORG', 'EVENT', 'WORK_OF_ART'})
+# Month name at the end of a lower-cased entity or followed by a space ("Oct 2025")
+_MONTH_SUFFIX_RE = re.compile(r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)(?: |\Z)')
+_GENERIC_TOPIC_WORDS = frozenset({'ai', 'tech', 'new', 'latest', 'best', 'top', 'guide', 'review', 'news'})
+_CASING_FIXES = {
+    'chatgpt': 'ChatGPT',
+    'openai': 'OpenAI',
+    'gpt': 'GPT',
+    'api': 'API',
+    'youtube': 'YouTube',
+    'microsoft': 'Microsoft',
+    'google': 'Google',
+    'apple': 'Apple',
+    'amazon': 'Amazon',
+    'meta': 'Meta',
+    'tesla': 'Tesla',
+    'nvidia': 'NVIDIA',
+    'amd': 'AMD',
+}
+
+
+@lru_cache(maxsize=1)
+def _shared_vectorizer() -> TfidfVectorizer:
+    """
+    TF-IDF vectorizer template shared by every service instance.
+
+    Never fitted - it only defines the analyzer (lowercasing, stop words,
+    n-gram range) - so sharing it across concurrent requests is safe. The
+    vocabulary limits (TFIDF_MAX_FEATURES, TFIDF_MIN_DF) are applied in
+    _cluster_keywords.
+    """
+    return TfidfVectorizer(
+        stop_words='english',
+        ngram_range=TrendConstants.TFIDF_NGRAM_RANGE
+    )
+
+
+def _pretokenized(terms: List[str]) -> List[str]:
+    """Analyzer for documents that were already run through the TF-IDF analyzer."""
+    return terms
+
+
+def _created_at_datetime64(item: Dict[str, Any]) -> np.datetime64:
+    """
+    Return an item's created_at as a naive-UTC datetime64 (NaT if missing/invalid).
+
+    Parsed on first touch and cached on the item, so later stages never
+    re-parse the ISO string.
+    """
+    value = item.get('_created_at_np')
+    if value is None:
+        value = _NAT
+        created_at = item.get('created_at')
+        if created_at:
+            try:
+                parsed = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+                if parsed.tzinfo is not None:
+                    parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+                value = np.datetime64(parsed, 'us')
+            except (TypeError, ValueError):
+                pass
+        item['_created_at_np'] = value
+    return value
+
+
 class TrendDetectionService(BaseService):
     """Service for detecting and analyzing trends from content."""
 
+    # spaCy pipeline shared by every instance, loaded on first use (stays None
+    # if the model is missing, so the load is attempted and reported only once)
+    _nlp: Optional[Any] = None
+    _nlp_loaded: bool = False
+    _nlp_lock = threading.Lock()
+
     def __init__(self, db: Optional[SupabaseManager] = None, min_confidence: float = None):
         super().__init__(db)
         self.min_confidence = min_confidence or TrendConstants.MIN_CONFIDENCE_THRESHOLD
-        self.vectorizer = TfidfVectorizer(
-            max_features=TrendConstants.TFIDF_MAX_FEATURES,
-            stop_words='english',
-            ngram_range=TrendConstants.TFIDF_NGRAM_RANGE,
-            min_df=TrendConstants.TFIDF_MIN_DF
+        self.vectorizer = _shared_vectorizer()
+        # Tokenizer/stop-word/n-gram pipeline built once; used to match keywords in titles
+        self._analyzer = self.vectorizer.build_analyzer()
+        # Stateless term counts - no vocabulary fit (fed the analyzer's terms, so no re-tokenizing)
+        self._hashing_vectorizer = HashingVectorizer(
+            n_features=TrendConstants.HASHING_N_FEATURES,
+            analyzer=_pretokenized,
+            alternate_sign=False,
+            norm=None,  # IDF weighting + L2 happen in _lsa_features
+            dtype=np.float32
         )
 
-        # Load spaCy for named entity recognition
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            self.logger.warning("spaCy model not found. Install with: python -m spacy download en_core_web_sm")
-            self.nlp = None
+        # Worker processes for large NER batches (1 = in-process; see TrendConstants.NER_N_PROCESS)
+        self._ner_n_process = max(1, TrendConstants.NER_N_PROCESS)
+
+    @property
+    def nlp(self) -> Optional[Any]:
+        """spaCy pipeline for named entity recognition (None if the model is unavailable)."""
+        cls = TrendDetectionService
+        if not cls._nlp_loaded:
+            with cls._nlp_lock:
+                if not cls._nlp_loaded:
+                    # Topic naming only reads entity spans, so the tagger/parser/lemmatizer
+                    # are never loaded (tok2vec + ner remain)
+                    try:
+                        cls._nlp = spacy.load(
+                            "en_core_web_sm",
+                            exclude=['tagger', 'parser', 'senter', 'attribute_ruler', 'lemmatizer']
+                        )
+                    except OSError:
+                        self.logger.warning("spaCy model not found. Install with: python -m spacy download en_core_web_sm")
+                        cls._nlp = None
+                    cls._nlp_loaded = True
+        return cls._nlp
 
     @handle_service_errors(default_return=([], {}), log_errors=True)
     async def detect_trends(
@@ -94,12 +204,29 @@ class TrendDetectionService(BaseService):
         if not 0.0 <= min_confidence <= 1.0:
             raise ValueError(f"min_confidence must be between 0.0 and 1.0, got {min_confidence}")
 
-        # Get recent content
-        cutoff_date = datetime.now() - timedelta(days=days_back)
-        current_items = self._get_recent_content(
-            str(workspace_id),
-            cutoff_date,
-            sources
+        # One clock reading for the whole run (window cutoffs, recency, fallbacks)
+        now = datetime.now(timezone.utc)
+
+        # Get recent content and the historical baseline (30 days before the window)
+        # concurrently - two range-bounded queries, so each window keeps its own
+        # row limit and a busy current window can't crowd out the baseline
+        # (naive UTC, like the stored created_at values)
+        cutoff_date = now.replace(tzinfo=None) - timedelta(days=days_back)
+        historical_cutoff = cutoff_date - timedelta(days=30)  # CHANGED: 30 days for better baseline
+        current_items, historical_items = await asyncio.gather(
+            asyncio.to_thread(
+                self._get_recent_content,
+                str(workspace_id),
+                cutoff_date,
+                sources
+            ),
+            asyncio.to_thread(
+                self._get_recent_content,
+                str(workspace_id),
+                historical_cutoff,
+                sources,
+                end_date=cutoff_date
+            )
         )
 
         if len(current_items) < 5:
@@ -112,18 +239,15 @@ class TrendDetectionService(BaseService):
                 "message": "Insufficient content for trend detection (minimum 5 items required)"
             }
 
-        # Get historical content for velocity calculation (30-day baseline)
-        historical_cutoff = cutoff_date - timedelta(days=30)  # CHANGED: 30 days for better baseline
-        historical_items = self._get_recent_content(
-            str(workspace_id),
-            historical_cutoff,
-            sources,
-            end_date=cutoff_date
+        # Stages 1-4 (extract, validate, velocity, merge, score) are CPU-bound spaCy /
+        # scikit-learn work: run them in one worker-thread hop to keep the event loop free
+        topics, scored_trends = await asyncio.to_thread(
+            self._analyze_content,
+            current_items,
+            historical_items,
+            now
         )
 
-        # Stage 1: Extract topics
-        topics = self._extract_topics(current_items)
-
         # Early return if no topics extracted
         if not topics or len(topics) == 0:
             return [], {
@@ -135,43 +259,21 @@ class TrendDetectionService(BaseService):
                 "message": "No topics could be extracted from content"
             }
 
-        # Stage 2: Calculate velocity
-        topics_with_velocity = self._calculate_velocity(
-            topics,
-            current_items,
-            historical_items
+        # Filter by confidence and keep the strongest max_trends before building any
+        # trend objects (partial sort on the stored 3-decimal score; ties keep
+        # extraction order, like a stable sort)
+        survivors = heapq.nlargest(
+            max_trends,
+            (t for t in scored_trends if round(t['strength_score'], 3) >= min_confidence),
+            key=lambda t: round(t['strength_score'], 3)
         )
 
-        # Stage 3: Cross-source validation
-        validated_topics = self._validate_cross_source(topics_with_velocity)
-
-        # Stage 3.5: Merge similar topics (NEW)
-        merged_topics = self._merge_similar_topics(validated_topics)
-
-        # Stage 4: Score and rank
-        scored_trends = self._score_trends(merged_topics)
-
-        # Stage 5: Generate explanations
-        trends_data = self._generate_explanations(scored_trends, workspace_id)
-
-        # Filter by confidence
-        filtered_trends = [
-            t for t in trends_data
-            if t.strength_score >= min_confidence
-        ][:max_trends]
+        # Stage 5: Generate explanations (status is still ranked against every scored trend)
+        filtered_trends = self._generate_explanations(survivors, workspace_id, now, scored_trends)
 
         # Save trends to database (UPSERT: update existing, insert new)
         # This prevents duplicate trends when detection runs multiple times
-        saved_trends = []
-        for trend_data in filtered_trends:
-            try:
-                # UPSERT: If (workspace_id, topic) exists, UPDATE strength/velocity
-                # Otherwise, INSERT new trend
-                saved_trend = self.db.upsert_trend(trend_data.model_dump(mode='json'))
-                saved_trends.append(TrendResponse(**saved_trend))
-            except Exception as e:
-                self.logger.error(f"Error upserting trend '{trend_data.topic}': {e}")
-                continue
+        saved_trends = await asyncio.to_thread(self._save_trends, filtered_trends)
 
         # Build analysis summary
         summary = {
@@ -186,6 +288,68 @@ class TrendDetectionService(BaseService):
 
         return saved_trends, summary
 
+    def _analyze_content(
+        self,
+        current_items: List[Dict[str, Any]],
+        historical_items: List[Dict[str, Any]],
+        now: datetime
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Run the synchronous detection stages: topic extraction, then validation,
+        velocity, merging and scoring.
+
+        Args:
+            current_items: Current period items
+            historical_items: Historical period items
+            now: Detection run time (timezone-aware UTC)
+
+        Returns:
+            Tuple of (extracted topics, scored trends); no scored trends when
+            no topics were extracted
+        """
+        topics = self._extract_topics(current_items, now)
+        if not topics:
+            return topics, []
+
+        return topics, self._build_trends(topics, current_items, historical_items)
+
+    def _save_trends(self, trends: List[TrendCreate]) -> List[TrendResponse]:
+        """
+        Upsert trends in one batched request, falling back to per-trend upserts.
+
+        The fallback keeps the old isolation: one bad trend is logged and
+        skipped instead of failing the whole batch.
+
+        Args:
+            trends: Trends to persist
+
+        Returns:
+            Saved trends
+        """
+        if not trends:
+            return []
+
+        trend_dicts = [trend.model_dump(mode='json') for trend in trends]
+
+        try:
+            # UPSERT: If (workspace_id, topic) exists, UPDATE strength/velocity
+            # Otherwise, INSERT new trend
+            saved_rows = self.db.upsert_trends_bulk(trend_dicts)
+            return [TrendResponse(**row) for row in saved_rows]
+        except Exception as e:
+            self.logger.warning(f"Bulk trend upsert failed, retrying one at a time: {e}")
+
+        saved_trends = []
+        for trend, trend_dict in zip(trends, trend_dicts):
+            try:
+                saved_trend = self.db.upsert_trend(trend_dict)
+                saved_trends.append(TrendResponse(**saved_trend))
+            except Exception as e:
+                self.logger.error(f"Error upserting trend '{trend.topic}': {e}")
+                continue
+
+        return saved_trends
+
     def _get_recent_content(
         self,
         workspace_id: str,
@@ -208,9 +372,14 @@ class TrendDetectionService(BaseService):
             self.logger.error(f"Error fetching content: {e}")
             return []
 
-    def _extract_topics(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _extract_topics(self, items: List[Dict[str, Any]], now: datetime) -> List[Dict[str, Any]]:
         """
-        Extract topics using TF-IDF + K-means clustering + NER.
+        Extract topics using hashed TF-IDF (LSA) features + clustering + NER.
+
+        Features need no vocabulary fit: analyzer terms are hashed, IDF-weighted
+        and reduced with LSA. Corpora up to AGGLOMERATIVE_MAX_ITEMS are
+        clustered with average-linkage agglomerative clustering over cosine
+        distances (one deterministic pass); larger ones with mini-batch K-means.
 
         Improvements:
         1. Named entity recognition for proper nouns
@@ -219,6 +388,7 @@ class TrendDetectionService(BaseService):
 
         Args:
             items: Content items
+            now: Detection run time (timezone-aware UTC)
 
         Returns:
             List of topic dictionaries
@@ -235,42 +405,100 @@ class TrendDetectionService(BaseService):
             texts.append(text)
 
         try:
-            # TF-IDF vectorization
-            tfidf_matrix = self.vectorizer.fit_transform(texts)
+            # Hashed features skip TF-IDF's vocabulary fit entirely
+            doc_terms = [self._analyzer(text) for text in texts]
+            feature_matrix = self._lsa_features(self._hashing_vectorizer.transform(doc_terms))
+
+            # Items with no analyzer terms (emoji- or stop-word-only titles), or whose
+            # terms LSA projected away, are zero rows: cosine distance is undefined for
+            # them, so they are left out as noise instead of failing the whole run
+            if issparse(feature_matrix):
+                has_features = feature_matrix.getnnz(axis=1) > 0
+            else:
+                has_features = np.any(feature_matrix, axis=1)
+            if not has_features.all():
+                keep = np.flatnonzero(has_features)
+                items = [items[i] for i in keep]
+                texts = [texts[i] for i in keep]
+                doc_terms = [doc_terms[i] for i in keep]
+                feature_matrix = feature_matrix[keep]
+                if len(items) < 5:
+                    return []
 
-            # K-means clustering
             n_clusters = min(10, max(3, len(items) // 10))
-            kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
-            clusters = kmeans.fit_predict(tfidf_matrix)
+            if len(texts) <= TrendConstants.AGGLOMERATIVE_MAX_ITEMS:
+                # Agglomerative clustering: the full distance matrix is small here,
+                # and one merge pass replaces K-means' restarts
+                if issparse(feature_matrix):
+                    feature_matrix = feature_matrix.toarray()
+                clusters = AgglomerativeClustering(
+                    n_clusters=n_clusters,
+                    metric='cosine',
+                    linkage='average'
+                ).fit_predict(feature_matrix)
+            else:
+                # Mini-batch K-means clustering
+                kmeans = MiniBatchKMeans(
+                    n_clusters=n_clusters,
+                    random_state=42,
+                    n_init=TrendConstants.KMEANS_N_INIT,
+                    batch_size=TrendConstants.KMEANS_BATCH_SIZE
+                )
+                clusters = kmeans.fit_predict(feature_matrix)
 
-            # Extract topic keywords for each cluster
-            topics = []
-            feature_names = self.vectorizer.get_feature_names_out()
+            # Top keywords for every cluster
+            cluster_keywords = self._cluster_keywords(doc_terms, clusters, n_clusters)
 
-            for cluster_id in range(n_clusters):
-                cluster_items = [items[i] for i in range(len(items)) if clusters[i] == cluster_id]
-                cluster_texts = [texts[i] for i in range(len(items)) if clusters[i] == cluster_id]
+            # Bucket items by cluster with one stable sort (original order kept within a cluster)
+            order = np.argsort(clusters, kind='stable')
+            boundaries = np.searchsorted(clusters[order], np.arange(n_clusters + 1))
+
+            cluster_members = [
+                (cluster_id, order[boundaries[cluster_id]:boundaries[cluster_id + 1]])
+                for cluster_id in range(n_clusters)
+            ]
+            cluster_members = [(cid, members) for cid, members in cluster_members if len(members) >= 2]
+
+            # NEW: Extract named entities for every clustered text in one batched spaCy pass
+            entities_by_doc = self._batch_extract_entities(
+                [texts[i] for _, members in cluster_members for i in members]
+            )
+
+            # Parse every created_at once, aligned with items (also cached per item for later stages)
+            created_at = np.fromiter(
+                (_created_at_datetime64(item) for item in items),
+                dtype='datetime64[us]',
+                count=len(items)
+            )
+
+            now_utc = np.datetime64(now.replace(tzinfo=None), 'us')
+
+            topics = []
+            offset = 0
 
-                if len(cluster_items) < 2:
-                    continue
+            for cluster_id, members in cluster_members:
+                cluster_items = [items[i] for i in members]
+                cluster_entities = entities_by_doc[offset:offset + len(members)]
+                offset += len(members)
 
-                # Get top keywords for this cluster
-                cluster_center = kmeans.cluster_centers_[cluster_id]
-                top_indices = cluster_center.argsort()[-10:][::-1]
-                keywords = [feature_names[i] for i in top_indices]
+                keywords = cluster_keywords[cluster_id]
 
-                # NEW: Extract named entities if spaCy available
-                topic_name = self._extract_topic_name(cluster_texts, keywords)
+                topic_name = self._extract_topic_name(self._count_topic_entities(cluster_entities), keywords)
 
                 # NEW: Calculate recency boost
-                recency_boost = self._calculate_recency_boost(cluster_items)
+                recency_boost = self._calculate_recency_boost(created_at[members], now_utc)
+
+                # Sources collected while the cluster is in hand (used by cross-source validation)
+                sources = {item.get('source', 'unknown') for item in cluster_items}
 
                 topics.append({
                     'topic': topic_name,
                     'keywords': keywords[:5],
                     'items': cluster_items,
                     'cluster_id': cluster_id,
-                    'recency_boost': recency_boost  # NEW
+                    'recency_boost': recency_boost,  # NEW
+                    'sources': sources,  # set until serialization in _generate_explanations
+                    'source_count': len(sources)
                 })
 
             return topics
@@ -279,7 +507,204 @@ class TrendDetectionService(BaseService):
             self.logger.error(f"Error in topic extraction: {e}")
             return []
 
-    def _extract_topic_name(self, cluster_texts: List[str], keywords: List[str]) -> str:
+    def _lsa_features(self, hashed_counts: Any) -> Any:
+        """
+        IDF-weight hashed term counts and project them onto a dense LSA space.
+
+        Clustering then runs on a small dense matrix instead of the wide
+        sparse one. Rows are re-normalized to unit length.
+
+        Args:
+            hashed_counts: Document x hashed-term count matrix
+
+        Returns:
+            Dense document x component matrix (or the TF-IDF matrix when the
+            corpus is too small to reduce)
+        """
+        tfidf = TfidfTransformer().fit_transform(hashed_counts)
+
+        n_components = min(
+            TrendConstants.LSA_N_COMPONENTS,
+            tfidf.shape[0] - 1,
+            tfidf.shape[1] - 1
+        )
+        if n_components < 2:
+            return tfidf
+
+        reduced = TruncatedSVD(n_components=n_components, random_state=42).fit_transform(tfidf)
+        return normalize(reduced, copy=False)
+
+    def _cluster_keywords(
+        self,
+        doc_terms: List[List[str]],
+        clusters: np.ndarray,
+        n_clusters: int,
+        top_k: int = 10
+    ) -> List[List[str]]:
+        """
+        Top keywords per cluster.
+
+        Hashed features have no vocabulary to read names back from, so terms
+        are ranked from the analyzer output directly: documents in the cluster
+        containing the term x smoothed IDF. Like TfidfVectorizer, candidates are
+        the TFIDF_MAX_FEATURES most frequent terms in the corpus that appear in
+        at least TFIDF_MIN_DF documents.
+
+        Args:
+            doc_terms: Analyzer terms per document
+            clusters: Cluster label per document
+            n_clusters: Number of clusters
+            top_k: Keywords to keep per cluster
+
+        Returns:
+            Keyword list per cluster id
+        """
+        n_docs = len(doc_terms)
+        term_frequency: Counter = Counter()
+        document_frequency: Counter = Counter()
+        doc_unique_terms = []
+
+        for terms in doc_terms:
+            term_frequency.update(terms)
+            unique_terms = set(terms)
+            document_frequency.update(unique_terms)
+            doc_unique_terms.append(unique_terms)
+
+        # Feature names, built once per run: the most frequent terms (ties alphabetical),
+        # stored alphabetically like get_feature_names_out so an index doubles as a tie-break
+        feature_names = sorted(sorted(
+            (term for term, df in document_frequency.items() if df >= TrendConstants.TFIDF_MIN_DF),
+            key=lambda term: (-term_frequency[term], term)
+        )[:TrendConstants.TFIDF_MAX_FEATURES])
+        if not feature_names:
+            return [[] for _ in range(n_clusters)]
+        term_index = {term: i for i, term in enumerate(feature_names)}
+
+        # Cluster x term matrix of documents containing the term, weighted by smoothed IDF
+        cluster_doc_counts = np.zeros((n_clusters, len(feature_names)))
+        for unique_terms, cluster_id in zip(doc_unique_terms, clusters.tolist()):
+            cluster_doc_counts[cluster_id, [term_index[t] for t in unique_terms if t in term_index]] += 1
+
+        document_counts = np.array([document_frequency[term] for term in feature_names], dtype=np.float64)
+        weights = cluster_doc_counts * (np.log((1 + n_docs) / (1 + document_counts)) + 1)
+
+        keywords = []
+        for row in weights:
+            candidates = np.flatnonzero(row)
+            if len(candidates) > top_k:
+                # Partial selection: keep everything tied with the k-th largest weight
+                kth_weight = np.partition(row[candidates], -top_k)[-top_k]
+                candidates = candidates[row[candidates] >= kth_weight]
+            # Highest weight first; ties prefer the alphabetically later term
+            top = candidates[np.lexsort((-candidates, -row[candidates]))[:top_k]]
+            keywords.append([feature_names[i] for i in top])
+
+        return keywords
+
+    def _batch_extract_entities(self, texts: List[str]) -> List[List[Tuple[str, str]]]:
+        """
+        Run spaCy NER over many texts in one batched pipe.
+
+        The pipeline is loaded with NER only (see the nlp property). Results
+        are cached by text hash, so repeat runs only pipe new or edited
+        content. Large batches of new texts are spread over worker processes;
+        small ones stay in-process, where worker startup would cost more than
+        it saves.
+
+        Args:
+            texts: Texts to analyze
+
+        Returns:
+            (entity text, label) pairs per text, in input order
+        """
+        if not self.nlp or not texts:
+            return [[] for _ in texts]
+
+        keys = [hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest() for text in texts]
+
+        with _entity_cache_lock:
+            found = {}
+            for key in keys:
+                if key in _entity_cache:
+                    _entity_cache.move_to_end(key)
+                    found[key] = _entity_cache[key]
+
+        # Only texts never seen before go through the pipeline (each distinct text once)
+        misses = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in misses:
+                misses[key] = text
+
+        if misses:
+            n_process = 1
+            if len(misses) >= TrendConstants.NER_PARALLEL_MIN_TEXTS:
+                n_process = self._ner_n_process
+
+            docs = self.nlp.pipe(
+                misses.values(),
+                batch_size=TrendConstants.NER_BATCH_SIZE,
+                n_process=n_process
+            )
+            extracted = {
+                key: [(ent.text, ent.label_) for ent in doc.ents]
+                for key, doc in zip(misses, docs)
+            }
+            found.update(extracted)
+
+            with _entity_cache_lock:
+                _entity_cache.update(extracted)
+                while len(_entity_cache) > TrendConstants.NER_CACHE_SIZE:
+                    _entity_cache.popitem(last=False)
+
+        return [found[key] for key in keys]
+
+    @staticmethod
+    def _count_topic_entities(cluster_entities: List[List[Tuple[str, str]]]) -> Counter:
+        """
+        Count a cluster's usable named entities (topic-like labels, noise filtered out).
+
+        Occurrences are tallied first, so each filter runs once per distinct
+        entity rather than once per mention. Counts keep first-seen order.
+
+        Args:
+            cluster_entities: (entity text, label) pairs per cluster text (see _batch_extract_entities)
+
+        Returns:
+            Mentions per entity text
+        """
+        mentions = Counter(
+            ent_text
+            for doc_entities in cluster_entities
+            for ent_text, ent_label in doc_entities
+            if ent_label in _ENTITY_LABELS
+        )
+
+        entities = Counter()
+        for ent_text, count in mentions.items():
+            entity_text = ent_text.strip()
+
+            # Filter out poor entity names:
+            # 1. Too short (< 3 chars)
+            if len(entity_text) < 3:
+                continue
+
+            # 2. All uppercase acronyms (< 5 chars) - likely noise
+            if entity_text.isupper() and len(entity_text) < 5:
+                continue
+
+            # 3. Month-ending entities (CompanyJan, Company Oct, Company-Oct, etc.)
+            if _MONTH_SUFFIX_RE.search(entity_text.lower()):
+                continue
+
+            entities[entity_text] += count
+
+        return entities
+
+    def _extract_topic_name(
+        self,
+        entities: Counter,
+        keywords: List[str]
+    ) -> str:
         """
         Extract meaningful topic name using NER and n-grams.
 
@@ -289,7 +714,7 @@ class TrendDetectionService(BaseService):
         3. Fallback to top keyword
 
         Args:
-            cluster_texts: List of text strings from the cluster
+            entities: Mentions per named entity in the cluster (see _count_topic_entities)
             keywords: List of TF-IDF keywords for the cluster
 
         Returns:
@@ -308,94 +733,38 @@ class TrendDetectionService(BaseService):
             # Safe to access keywords[0] now (validated above)
             return keywords[0].replace('_', ' ').title()
 
-        # Extract named entities from cluster texts
-        entities = defaultdict(int)
-        month_suffixes = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                         'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-
-        for text in cluster_texts:
-            doc = self.nlp(text)
-            for ent in doc.ents:
-                if ent.label_ in ['PRODUCT', 'ORG', 'EVENT', 'WORK_OF_ART']:
-                    entity_text = ent.text.strip()
-
-                    # Filter out poor entity names:
-                    # 1. Too short (< 3 chars)
-                    if len(entity_text) < 3:
-                        continue
-
-                    # 2. All uppercase acronyms (< 5 chars) - likely noise
-                    if entity_text.isupper() and len(entity_text) < 5:
-                        continue
-
-                    # 3. Month-ending entities (CompanyJan, Company Oct, Company-Oct, etc.)
-                    entity_lower = entity_text.lower()
-                    skip_month = False
-                    for month in month_suffixes:
-                        month_lower = month.lower()
-                        if (entity_lower.endswith(month_lower) or
-                            entity_lower.endswith(f' {month_lower}') or
-                            entity_lower.endswith(f'-{month_lower}') or
-                            f'{month_lower} ' in entity_lower):  # "Oct 2025" patterns
-                            skip_month = True
-                            break
-
-                    if skip_month:
-                        continue
-
-                    entities[entity_text] += 1
-
-        # Boost entities that appear in top keywords (relevance weighting)
+        # Boost entities that appear in top keywords (relevance weighting) and keep
+        # the best one in the same pass; ties go to the first-seen entity.
         # This ensures we pick entities related to the cluster's main topic
-        if entities and keywords:
-            for entity_text in list(entities.keys()):
+        if entities:
+            top_keywords = [keyword.lower() for keyword in keywords[:3]]
+            top_entity, top_score = None, -1
+
+            for entity_text, count in entities.items():
                 entity_lower = entity_text.lower()
+                score = count
 
                 # Boost if entity matches or is substring of top 3 keywords
-                for i, keyword in enumerate(keywords[:3]):
-                    keyword_lower = keyword.lower()
-
+                for i, keyword_lower in enumerate(top_keywords):
                     # Exact match or entity is part of keyword
-                    if entity_lower == keyword_lower or entity_lower in keyword_lower:
+                    if entity_lower in keyword_lower:
                         # Higher boost for top keywords (3x for #1, 2x for #2, 1.5x for #3)
-                        boost = 3.0 - (i * 0.5)
-                        entities[entity_text] = int(entities[entity_text] * boost)
+                        score = int(count * (3.0 - (i * 0.5)))
                         break
 
                     # Keyword is part of entity (e.g., "chat" in "ChatGPT")
                     if keyword_lower in entity_lower and len(keyword_lower) >= 3:
-                        boost = 2.0 - (i * 0.3)
-                        entities[entity_text] = int(entities[entity_text] * boost)
+                        score = int(count * (2.0 - (i * 0.3)))
                         break
 
-        # Return most relevant named entity (now weighted by keyword relevance)
-        if entities:
-            top_entity = max(entities.items(), key=lambda x: x[1])[0]
+                if score > top_score:
+                    top_entity, top_score = entity_text, score
 
             # Fix common casing issues
-            casing_fixes = {
-                'chatgpt': 'ChatGPT',
-                'openai': 'OpenAI',
-                'gpt': 'GPT',
-                'api': 'API',
-                'youtube': 'YouTube',
-                'microsoft': 'Microsoft',
-                'google': 'Google',
-                'apple': 'Apple',
-                'amazon': 'Amazon',
-                'meta': 'Meta',
-                'tesla': 'Tesla',
-                'nvidia': 'NVIDIA',
-                'amd': 'AMD',
-            }
-
-            entity_key = top_entity.lower()
-            if entity_key in casing_fixes:
-                top_entity = casing_fixes[entity_key]
+            top_entity = _CASING_FIXES.get(top_entity.lower(), top_entity)
 
             # Reject generic single words (fall back to n-grams instead)
-            generic_words = {'ai', 'tech', 'new', 'latest', 'best', 'top', 'guide', 'review', 'news'}
-            if top_entity.lower() in generic_words:
+            if top_entity.lower() in _GENERIC_TOPIC_WORDS:
                 # Fall through to n-gram fallback below
                 pass
             else:
@@ -411,44 +780,42 @@ class TrendDetectionService(BaseService):
         # Final fallback
         return keywords[0].replace('_', ' ').title()
 
-    def _calculate_recency_boost(self, cluster_items: List[Dict[str, Any]]) -> float:
+    def _calculate_recency_boost(self, item_times: np.ndarray, now: np.datetime64) -> float:
         """
         Calculate recency boost for topics mentioned in last 24 hours.
 
         Args:
-            cluster_items: List of content items in the cluster
+            item_times: created_at of the cluster's items (naive-UTC datetime64, NaT if unknown)
+            now: Detection run time (naive-UTC datetime64)
 
         Returns:
             Float between 0.0 and 0.3 (max 30% boost)
         """
-        now = datetime.now()
-        recent_threshold = now - timedelta(hours=24)
-
-        recent_count = 0
-        for item in cluster_items:
-            created_at = item.get('created_at')
-            if created_at:
-                try:
-                    item_time = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    if item_time >= recent_threshold:
-                        recent_count += 1
-                except:
-                    pass
-
         # Calculate boost: 0-30% based on percentage of recent items
-        if len(cluster_items) == 0:
+        if len(item_times) == 0:
             return 0.0
 
-        recent_percentage = recent_count / len(cluster_items)
+        # Timestamps are normalized to UTC, so compare against UTC now (NaT never counts)
+        recent_threshold = now - np.timedelta64(24, 'h')
+        recent_count = int(np.count_nonzero(item_times >= recent_threshold))
+
+        recent_percentage = recent_count / len(item_times)
         return min(recent_percentage * 0.3, 0.3)  # Cap at 30%
 
     def _merge_similar_topics(self, topics: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Merge topics with >50% keyword overlap.
+        Merge topics with the same name or high keyword overlap.
 
         Example: "Ai" and "Chatgpt" both have keywords ["atlas", "opened"]
         → Merge into single topic "ChatGPT Atlas"
 
+        Similar pairs form a sparse graph: name matches, plus keyword pairs
+        (found through a keyword -> topic index, so only topics sharing a
+        keyword are compared) that pass the Jaccard and shared-keyword
+        thresholds. Each connected component becomes one topic, so merges are
+        transitive. Each merged topic builds on its first member (velocity and
+        recency boost included); the member with the highest velocity names it.
+
         Args:
             topics: List of topic dictionaries
 
@@ -458,75 +825,138 @@ class TrendDetectionService(BaseService):
         if len(topics) <= 1:
             return topics
 
-        merged = []
-        used = set()
+        edge_rows: List[int] = []
+        edge_cols: List[int] = []
+
+        # Fallback 1: Merge topics with exact same name (case-insensitive)
+        topics_by_name = defaultdict(list)
+        for idx, topic in enumerate(topics):
+            topics_by_name[topic['topic'].lower().strip()].append(idx)
+
+        for same_name in topics_by_name.values():
+            for other in same_name[1:]:
+                self.logger.debug(
+                    f"Merging topics by name: '{topics[same_name[0]]['topic']}' + '{topics[other]['topic']}' (exact name match)"
+                )
+                edge_rows.append(same_name[0])
+                edge_cols.append(other)
+
+        # Fallback 2: Merge topics with high keyword overlap. Shared-keyword counts come
+        # from one sparse topic x keyword product; its nonzeros are exactly the pairs
+        # sharing a keyword, so no other pair is ever looked at.
+        keyword_ids: Dict[str, int] = {}
+        topic_rows, keyword_cols = [], []
+        for idx, topic in enumerate(topics):
+            for kw in set(topic['keywords']):
+                topic_rows.append(idx)
+                keyword_cols.append(keyword_ids.setdefault(kw, len(keyword_ids)))
+
+        topic_keywords = csr_matrix(
+            (np.ones(len(topic_rows), dtype=np.int32), (topic_rows, keyword_cols)),
+            shape=(len(topics), len(keyword_ids))
+        )
+        keyword_counts = topic_keywords.getnnz(axis=1)
+        shared = triu(topic_keywords @ topic_keywords.T, k=1).tocoo()
+
+        pair_i, pair_j, shared_counts = shared.row, shared.col, shared.data
+        overlaps = shared_counts / (keyword_counts[pair_i] + keyword_counts[pair_j] - shared_counts)  # Jaccard similarity
+
+        # Use configurable thresholds from constants
+        qualifies = (
+            (overlaps >= TrendConstants.TOPIC_MERGE_SIMILARITY_THRESHOLD) &
+            (shared_counts >= TrendConstants.TOPIC_MERGE_MIN_KEYWORD_OVERLAP)
+        )
+        for i, j, overlap, shared_kw in zip(
+            pair_i[qualifies].tolist(), pair_j[qualifies].tolist(),
+            overlaps[qualifies].tolist(), shared_counts[qualifies].tolist()
+        ):
+            # Log merge decision for debugging
+            self.logger.debug(
+                f"Merging topics by keywords: '{topics[i]['topic']}' + '{topics[j]['topic']}' "
+                f"(overlap={overlap:.2f}, shared_kw={shared_kw}, threshold={TrendConstants.TOPIC_MERGE_SIMILARITY_THRESHOLD})"
+            )
+            edge_rows.append(i)
+            edge_cols.append(j)
+
+        if not edge_rows:
+            return topics
+
+        graph = csr_matrix(
+            (np.ones(len(edge_rows), dtype=np.int8), (edge_rows, edge_cols)),
+            shape=(len(topics), len(topics))
+        )
+        _, labels = connected_components(graph, directed=False)
+
+        # Components in order of their first topic (keeps the input ranking)
+        components = defaultdict(list)
+        for idx, label in enumerate(labels.tolist()):
+            components[label].append(idx)
 
-        for i, topic1 in enumerate(topics):
-            if i in used:
+        merged = []
+        for members in components.values():
+            if len(members) == 1:
+                merged.append(topics[members[0]])
                 continue
 
-            kw1 = set(topic1['keywords'])
-            merged_topic = topic1.copy()
-
-            # Find similar topics to merge
-            for j, topic2 in enumerate(topics[i+1:], start=i+1):
-                if j in used:
-                    continue
-
-                # Fallback 1: Merge topics with exact same name (case-insensitive)
-                if topic1['topic'].lower().strip() == topic2['topic'].lower().strip():
-                    self.logger.debug(
-                        f"Merging topics by name: '{topic1['topic']}' + '{topic2['topic']}' (exact name match)"
-                    )
-
-                    kw2 = set(topic2['keywords'])
-
-                    # Merge topic2 into topic1
-                    merged_topic['items'].extend(topic2['items'])
-                    merged_topic['keywords'] = list(set(topic1['keywords']) | kw2)[:5]
-                    merged_topic['mention_count'] += topic2['mention_count']
-                    merged_topic['sources'] = list(set(merged_topic['sources'] + topic2['sources']))
-                    merged_topic['source_count'] = len(merged_topic['sources'])
-
-                    # Use topic name from higher velocity topic
-                    if topic2.get('velocity', 0) > topic1.get('velocity', 0):
-                        merged_topic['topic'] = topic2['topic']
-
-                    used.add(j)
-                    continue  # Skip keyword overlap check
-
-                # Fallback 2: Merge topics with high keyword overlap
-                kw2 = set(topic2['keywords'])
-                overlap = len(kw1 & kw2) / len(kw1 | kw2)  # Jaccard similarity
-                shared_keywords = kw1 & kw2
-
-                # Use configurable thresholds from constants
-                if (overlap >= TrendConstants.TOPIC_MERGE_SIMILARITY_THRESHOLD and
-                    len(shared_keywords) >= TrendConstants.TOPIC_MERGE_MIN_KEYWORD_OVERLAP):
-                    # Log merge decision for debugging
-                    self.logger.debug(
-                        f"Merging topics by keywords: '{topic1['topic']}' + '{topic2['topic']}' "
-                        f"(overlap={overlap:.2f}, shared_kw={len(shared_keywords)}, threshold={TrendConstants.TOPIC_MERGE_SIMILARITY_THRESHOLD})"
-                    )
-
-                    # Merge topic2 into topic1
-                    merged_topic['items'].extend(topic2['items'])
-                    merged_topic['keywords'] = list(kw1 | kw2)[:5]  # Union of keywords
-                    merged_topic['mention_count'] += topic2['mention_count']
-                    merged_topic['sources'] = list(set(merged_topic['sources'] + topic2['sources']))
-                    merged_topic['source_count'] = len(merged_topic['sources'])
-
-                    # Use topic name from higher velocity topic
-                    if topic2.get('velocity', 0) > topic1.get('velocity', 0):
-                        merged_topic['topic'] = topic2['topic']
-
-                    used.add(j)
+            # Merge into the first member (keeps its velocity and recency boost, as before);
+            # the name comes from the highest-velocity member, ties going to the earliest
+            merged_topic = topics[members[0]].copy()
+            representative = max(members, key=lambda idx: topics[idx].get('velocity', 0))
+            merged_topic['topic'] = topics[representative]['topic']
+
+            merged_topic['items'] = [item for idx in members for item in topics[idx]['items']]
+            merged_topic['keywords'] = list(dict.fromkeys(
+                kw for idx in members for kw in topics[idx]['keywords']
+            ))[:5]  # Union of keywords, highest-ranked first
+            merged_topic['mention_count'] = sum(topics[idx]['mention_count'] for idx in members)
+            merged_topic['sources'] = set().union(*(topics[idx]['sources'] for idx in members))
+            merged_topic['source_count'] = len(merged_topic['sources'])
 
             merged.append(merged_topic)
-            used.add(i)
 
         return merged
 
+    def _build_trends(
+        self,
+        topics: List[Dict[str, Any]],
+        current_items: List[Dict[str, Any]],
+        historical_items: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Turn extracted topics into scored, ranked trend candidates.
+
+        Cross-source validation only needs the source sets gathered during
+        extraction, so it runs first: mention counting (the only stage that
+        touches every item) then covers just the topics that can survive.
+        Merging has to see velocities and scoring has to see merged counts,
+        so those two keep their order.
+
+        Args:
+            topics: Extracted topics
+            current_items: Current period items
+            historical_items: Historical period items
+
+        Returns:
+            Scored topics
+        """
+        # Stage 2: Cross-source validation
+        validated_topics = self._validate_cross_source(topics)
+        if not validated_topics:
+            return []
+
+        # Stage 3: Calculate velocity (one batched pass over each window)
+        topics_with_velocity = self._calculate_velocity(
+            validated_topics,
+            current_items,
+            historical_items
+        )
+
+        # Stage 3.5: Merge similar topics (NEW)
+        merged_topics = self._merge_similar_topics(topics_with_velocity)
+
+        # Stage 4: Score
+        return self._score_trends(merged_topics)
+
     def _calculate_velocity(
         self,
         topics: List[Dict[str, Any]],
@@ -544,27 +974,28 @@ class TrendDetectionService(BaseService):
         Returns:
             Topics with velocity added
         """
-        for topic in topics:
-            keywords = topic['keywords']
+        # Keyword -> topic incidence matrix over the union of all topic keywords
+        keyword_ids: Dict[str, int] = {}
+        keyword_rows, topic_cols = [], []
+        for topic_idx, topic in enumerate(topics):
+            for kw in {kw.lower() for kw in topic['keywords']}:
+                keyword_rows.append(keyword_ids.setdefault(kw, len(keyword_ids)))
+                topic_cols.append(topic_idx)
+
+        keyword_topics = csr_matrix(
+            (np.ones(len(keyword_rows), dtype=np.int32), (keyword_rows, topic_cols)),
+            shape=(len(keyword_ids), len(topics))
+        )
 
-            # Count mentions in current window
-            current_mentions = len([
-                item for item in current_items
-                if any(
-                    kw.lower() in item.get('title', '').lower()
-                    for kw in keywords
-                )
-            ])
-
-            # Count mentions in historical window
-            historical_mentions = len([
-                item for item in historical_items
-                if any(
-                    kw.lower() in item.get('title', '').lower()
-                    for kw in keywords
-                )
-            ]) if historical_items else 0
+        current_counts, historical_counts = self._count_keyword_mentions(
+            [current_items, historical_items],
+            keyword_ids,
+            keyword_topics
+        )
 
+        for topic, current_mentions, historical_mentions in zip(
+            topics, current_counts.tolist(), historical_counts.tolist()
+        ):
             # Calculate velocity (percentage increase)
             if historical_mentions > 0:
                 velocity = ((current_mentions - historical_mentions) / historical_mentions) * 100
@@ -578,6 +1009,56 @@ class TrendDetectionService(BaseService):
 
         return topics
 
+    def _count_keyword_mentions(
+        self,
+        windows: List[List[Dict[str, Any]]],
+        keyword_ids: Dict[str, int],
+        keyword_topics: csr_matrix
+    ) -> List[np.ndarray]:
+        """
+        Count, per window and topic, the items whose title mentions any topic keyword.
+
+        Every title (across all windows) goes through the vectorizer's analyzer
+        once (same lowercasing, stop words and 1-3 gram range the keywords came
+        from) into one binary item x keyword matrix over the deduplicated
+        keyword set; one sparse product against the keyword x topic incidence
+        matrix then gives every (item, topic) hit. Counts are distinct items,
+        so an item matching several keywords of a topic counts once.
+
+        Args:
+            windows: Item lists to count separately (e.g. current, historical)
+            keyword_ids: Keyword -> row index in keyword_topics
+            keyword_topics: Keyword x topic incidence matrix
+
+        Returns:
+            Array of mention counts (one per topic) for each window
+        """
+        n_topics = keyword_topics.shape[1]
+        if not keyword_ids:
+            return [np.zeros(n_topics, dtype=np.int64) for _ in windows]
+
+        # Fixed-vocabulary binary CountVectorizer: no fit, C-level CSR assembly
+        keyword_counter = CountVectorizer(
+            analyzer=self._analyzer,
+            vocabulary=keyword_ids,
+            binary=True,
+            dtype=np.int32
+        )
+        item_keywords = keyword_counter.transform(
+            item.get('title', '') for items in windows for item in items
+        )
+        hits = (item_keywords @ keyword_topics).tocsr()
+
+        # Non-zeros per topic column = items matching at least one keyword
+        counts = []
+        start = 0
+        for items in windows:
+            end = start + len(items)
+            counts.append(hits[start:end].getnnz(axis=0))
+            start = end
+
+        return counts
+
     def _validate_cross_source(self, topics: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Filter topics that appear in multiple sources.
@@ -588,18 +1069,9 @@ class TrendDetectionService(BaseService):
         Returns:
             Validated topics
         """
-        validated = []
-
-        for topic in topics:
-            sources = set(item.get('source', 'unknown') for item in topic['items'])
-
-            # Require at least 2 different sources for validation
-            if len(sources) >= 2:
-                topic['sources'] = list(sources)
-                topic['source_count'] = len(sources)
-                validated.append(topic)
-
-        return validated
+        # Require at least 2 different sources for validation
+        # (source sets are computed once per cluster in _extract_topics)
+        return [topic for topic in topics if topic['source_count'] >= 2]
 
     def _score_trends(self, topics: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -615,66 +1087,70 @@ class TrendDetectionService(BaseService):
             topics: Topics to score
 
         Returns:
-            Scored topics sorted by strength
+            Scored topics (ranking happens once, when detect_trends picks the top trends)
         """
-        for topic in topics:
-            score = 0.0
-
-            # Factor 1: Mention count (20% weight) - REDUCED
-            mention_score = min(topic['mention_count'] / 20, 1.0)
-            score += mention_score * TrendConstants.MENTION_SCORE_WEIGHT  # 0.2
-
-            # Factor 2: Velocity (60% weight) - INCREASED
-            velocity_score = min(topic.get('velocity', 0) / 100.0, 1.0)
-            score += velocity_score * TrendConstants.VELOCITY_SCORE_WEIGHT  # 0.6
+        if not topics:
+            return topics
 
-            # Factor 3: Source diversity (20% weight) - REDUCED
-            source_score = min(topic['source_count'] / 4, 1.0)
-            score += source_score * TrendConstants.SOURCE_DIVERSITY_WEIGHT  # 0.2
+        mentions = np.fromiter((t['mention_count'] for t in topics), dtype=np.float64, count=len(topics))
+        velocities = np.fromiter((t.get('velocity', 0) for t in topics), dtype=np.float64, count=len(topics))
+        source_counts = np.fromiter((t['source_count'] for t in topics), dtype=np.float64, count=len(topics))
+        recency_boosts = np.fromiter((t.get('recency_boost', 0.0) for t in topics), dtype=np.float64, count=len(topics))
+
+        # Factors are clipped to [0, 1]; a shrinking topic (negative velocity)
+        # contributes nothing rather than dragging the score below zero
+        scores = (
+            np.clip(mentions / 20, 0.0, 1.0) * TrendConstants.MENTION_SCORE_WEIGHT        # 0.2
+            + np.clip(velocities / 100.0, 0.0, 1.0) * TrendConstants.VELOCITY_SCORE_WEIGHT  # 0.6
+            + np.clip(source_counts / 4, 0.0, 1.0) * TrendConstants.SOURCE_DIVERSITY_WEIGHT  # 0.2
+            + recency_boosts                                                               # up to 0.3
+        )
 
-            # Factor 4: Recency boost (up to 30% extra) - NEW
-            recency_boost = topic.get('recency_boost', 0.0)
-            score += recency_boost
+        # Cap total score at 1.0
+        scores = np.minimum(scores, 1.0)
 
-            # Cap total score at 1.0
-            score = min(score, 1.0)
+        # Confidence level
+        levels = np.where(
+            scores >= TrendConstants.HIGH_CONFIDENCE_THRESHOLD, 'high',
+            np.where(scores >= TrendConstants.MEDIUM_CONFIDENCE_THRESHOLD, 'medium', 'low')
+        )
 
+        for topic, score, level in zip(topics, scores.tolist(), levels.tolist()):
             topic['strength_score'] = score
-
-            # Confidence level
-            if score >= 0.75:
-                topic['confidence_level'] = 'high'
-            elif score >= 0.5:
-                topic['confidence_level'] = 'medium'
-            else:
-                topic['confidence_level'] = 'low'
-
-        # Sort by score
-        topics.sort(key=lambda x: x['strength_score'], reverse=True)
+            topic['confidence_level'] = level
 
         return topics
 
     def _generate_explanations(
         self,
         topics: List[Dict[str, Any]],
-        workspace_id: UUID
+        workspace_id: UUID,
+        now: datetime,
+        population: Optional[List[Dict[str, Any]]] = None
     ) -> List[TrendCreate]:
         """
         Generate AI explanations for trends.
 
         Args:
-            topics: Scored topics
+            topics: Scored topics to build trends for
             workspace_id: Workspace ID
+            now: Detection run time (timezone-aware UTC; timestamp fallback)
+            population: Every scored topic of the run, for status percentiles
+                (defaults to topics)
 
         Returns:
             List of TrendCreate objects
         """
+        if population is None:
+            population = topics
+
         trends = []
 
         for topic_data in topics:
             # Create simple explanation (could enhance with AI later)
             item_count = len(topic_data['items'])
-            sources_str = ", ".join(topic_data['sources'][:3])
+            sources = list(topic_data['sources'])
+            sources_str = ", ".join(sources[:3])
             velocity = topic_data.get('velocity', 0)
 
             if velocity > 50:
@@ -696,15 +1172,19 @@ class TrendDetectionService(BaseService):
                 if item.get('id')
             ]
 
-            # Get timestamps
-            item_times = [
-                datetime.fromisoformat(item['created_at'].replace('Z', '+00:00'))
-                for item in topic_data['items']
-                if item.get('created_at')
-            ]
+            # Get timestamps (parsed once per item, reduced in NumPy)
+            item_times = np.fromiter(
+                (_created_at_datetime64(item) for item in topic_data['items']),
+                dtype='datetime64[us]',
+                count=len(topic_data['items'])
+            )
+            item_times = item_times[~np.isnat(item_times)]
 
-            first_seen = min(item_times) if item_times else datetime.now()
-            peak_time = max(item_times) if item_times else datetime.now()
+            if item_times.size:
+                first_seen = item_times.min().item().replace(tzinfo=timezone.utc)
+                peak_time = item_times.max().item().replace(tzinfo=timezone.utc)
+            else:
+                first_seen = peak_time = now
 
             # Create trend object (status will be computed after all trends are created)
             trend = TrendCreate(
@@ -714,7 +1194,7 @@ class TrendDetectionService(BaseService):
                 strength_score=round(topic_data['strength_score'], 3),
                 mention_count=topic_data['mention_count'],
                 velocity=round(topic_data.get('velocity', 0), 2),
-                sources=topic_data['sources'],
+                sources=sources,
                 source_count=topic_data['source_count'],
                 key_content_item_ids=key_item_ids,
                 first_seen=first_seen,
@@ -729,26 +1209,15 @@ class TrendDetectionService(BaseService):
             trends.append(trend)
 
         # Compute status for each trend (after all trends are created)
-        # This allows percentile-based classification using the full trend set
+        # Thresholds come from the full scored population, as stored on a trend
+        # (3-decimal strength, 2-decimal velocity), so percentile-based
+        # classification is unaffected by which trends were kept
+        thresholds = self._status_thresholds(
+            [round(t['strength_score'], 3) for t in population],
+            [round(t.get('velocity', 0), 2) for t in population]
+        )
         for trend in trends:
-            # Convert TrendCreate to TrendResponse for status computation
-            # Add missing required fields (id, detected_at, created_at, updated_at)
-            trend_data = trend.model_dump()
-            trend_data['id'] = uuid4()
-            trend_data['detected_at'] = datetime.now(timezone.utc)
-            trend_data['created_at'] = datetime.now(timezone.utc)
-            trend_data['updated_at'] = datetime.now(timezone.utc)
-
-            trend_response = TrendResponse(**trend_data)
-            trend.status = self._compute_trend_status(trend_response, [
-                TrendResponse(**{
-                    **t.model_dump(),
-                    'id': uuid4(),
-                    'detected_at': datetime.now(timezone.utc),
-                    'created_at': datetime.now(timezone.utc),
-                    'updated_at': datetime.now(timezone.utc)
-                }) for t in trends
-            ])
+            trend.status = self._compute_trend_status(trend, thresholds)
 
         return trends
 
@@ -770,9 +1239,31 @@ class TrendDetectionService(BaseService):
             'declining_score': 0.4       # <40% strength = declining
         }
 
+    def _status_thresholds(
+        self,
+        strengths: List[float],
+        velocities: List[Optional[float]]
+    ) -> Dict[str, float]:
+        """
+        Pick status thresholds for a trend population.
+
+        Uses adaptive percentile thresholds for n>=10, fixed thresholds for n<10.
+
+        Args:
+            strengths: Strength score per trend
+            velocities: Velocity per trend (None if unknown)
+
+        Returns:
+            Dictionary of threshold values
+        """
+        if len(strengths) >= 10:
+            return self._calculate_percentile_thresholds(strengths, velocities)
+        return self._get_fixed_thresholds()
+
     def _calculate_percentile_thresholds(
         self,
-        trends: List[TrendResponse]
+        strengths: List[float],
+        velocities: List[Optional[float]]
     ) -> Dict[str, float]:
         """
         Calculate adaptive percentile thresholds for trend classification (n>=10).
@@ -781,15 +1272,15 @@ class TrendDetectionService(BaseService):
         Handles edge cases: NULL velocities, empty lists, insufficient data points.
 
         Args:
-            trends: List of trends to analyze
+            strengths: Strength score per trend
+            velocities: Velocity per trend (None if unknown)
 
         Returns:
             Dictionary of calculated thresholds, or fixed thresholds if calculation fails
         """
         try:
-            # Extract velocities and strengths, filtering out NULLs
-            velocities = [t.velocity for t in trends if t.velocity is not None]
-            strengths = [t.strength_score for t in trends]
+            # Filter out NULL velocities
+            velocities = [v for v in velocities if v is not None]
 
             # Need minimum 3 data points for valid percentile calculation
             if len(velocities) < 3 or len(strengths) < 3:
@@ -809,7 +1300,7 @@ class TrendDetectionService(BaseService):
             }
 
             self.logger.debug(
-                f"Calculated percentile thresholds from {len(trends)} trends: "
+                f"Calculated percentile thresholds from {len(strengths)} trends: "
                 f"rising_vel={thresholds['rising_velocity']:.2f}, "
                 f"hot_score={thresholds['hot_score']:.2f}, "
                 f"peak_score={thresholds['peak_score']:.2f}"
@@ -825,8 +1316,8 @@ class TrendDetectionService(BaseService):
 
     def _compute_trend_status(
         self,
-        trend: TrendResponse,
-        all_trends: List[TrendResponse]
+        trend: TrendCreate,
+        thresholds: Dict[str, float]
     ) -> str:
         """
         Compute trend lifecycle status using industry-standard classification.
@@ -843,17 +1334,11 @@ class TrendDetectionService(BaseService):
 
         Args:
             trend: Trend to classify
-            all_trends: All trends in workspace (for percentile calculation)
+            thresholds: Status thresholds for the trend population (see _status_thresholds)
 
         Returns:
             Status string: emerging, rising, hot, peak, or declining
         """
-        # Choose threshold calculation method based on sample size
-        if len(all_trends) >= 10:
-            thresholds = self._calculate_percentile_thresholds(all_trends)
-        else:
-            thresholds = self._get_fixed_thresholds()
-
         # Extract trend metrics
         score = trend.strength_score
         vel = trend.velocity if trend.velocity is not None else 0.0
@@ -949,32 +1434,27 @@ class TrendDetectionService(BaseService):
             start_date=cutoff
         )
 
-        # Calculate statistics
+        # Calculate statistics (one flattened Counter call counts every trend's sources)
         total_trends = len(all_trends)
-        active_trends = len([t for t in all_trends if t.get('is_active', False)])
+        active_trends = sum(1 for trend in all_trends if trend.get('is_active', False))
+        total_strength = sum(trend.get('strength_score', 0) for trend in all_trends)
+        source_counts = Counter(chain.from_iterable(trend.get('sources') or [] for trend in all_trends))
 
         # Top sources
-        all_sources = []
-        for trend in all_trends:
-            all_sources.extend(trend.get('sources', []))
-
-        source_counts = Counter(all_sources)
         top_sources = [
             {"source": source, "count": count}
             for source, count in source_counts.most_common(5)
         ]
 
         # Average strength
-        avg_strength = (
-            sum(t.get('strength_score', 0) for t in all_trends) / total_trends
-            if total_trends > 0 else 0.0
-        )
+        avg_strength = total_strength / total_trends if total_trends > 0 else 0.0
 
-        # Get content count
-        total_content = len(self._get_recent_content(
-            str(workspace_id),
-            cutoff
-        ))
+        # Get content count (count query - no rows materialized)
+        try:
+            total_content = self.db.count_content_items(str(workspace_id), start_date=cutoff)
+        except Exception as e:
+            self.logger.error(f"Error counting content: {e}")
+            total_content = 0
 
         return TrendAnalysisSummary(
             workspace_id=workspace_id,
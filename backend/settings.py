@@ -81,6 +81,9 @@ class Settings(BaseSettings):
     rate_limit_enabled: bool = True
     rate_limit_per_minute: int = 60
 
+    # Email Tracking
+    enable_click_tracking: bool = True  # False = plain UTM links, no /track/click redirect
+
     # Railway (auto-detected)
     railway_public_domain: Optional[str] = None
     railway_environment: Optional[str] = None
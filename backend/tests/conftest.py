@@ -16,13 +16,12 @@ from typing import Dict, Generator
 from fastapi.testclient import TestClient
 from supabase import create_client, Client
 
-# Import your FastAPI app
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from backend.main import app
-from backend.database import get_supabase_service_client
+# The FastAPI app and Supabase service client are imported inside their
+# fixtures, so unit tests (tests/unit) run without the app or a database
 
 
 # =============================================================================
@@ -58,6 +57,8 @@ def test_client() -> Generator[TestClient, None, None]:
 
     Scope: session (one client for all tests)
     """
+    from backend.main import app
+
     with TestClient(app) as client:
         yield client
 
@@ -70,6 +71,8 @@ def supabase_client() -> Client:
     Uses service key to bypass RLS for test verification.
     Scope: session (one client for all tests)
     """
+    from backend.database import get_supabase_service_client
+
     return get_supabase_service_client()
 
 
@@ -283,39 +286,3 @@ def db_helpers(supabase_client: Client):
                 return False
 
     return DBHelpers(supabase_client)
-
-
-# =============================================================================
-# CLEANUP FIXTURES
-# =============================================================================
-
-@pytest.fixture(scope="session", autouse=True)
-def cleanup_old_test_data(supabase_client: Client):
-    """
-    Clean up old test data before test session starts.
-
-    Removes test users and workspaces older than 1 hour.
-    Scope: session (runs once before all tests)
-    """
-    from datetime import datetime, timedelta
-
-    cutoff_time = datetime.utcnow() - timedelta(hours=1)
-
-    try:
-        # Clean up old test workspaces
-        supabase_client.table("workspaces").delete().like("name", "Test Workspace%").lt(
-            "created_at", cutoff_time.isoformat()
-        ).execute()
-
-        # Clean up old test users
-        supabase_client.table("users").delete().like("email", "%@example.com").lt(
-            "created_at", cutoff_time.isoformat()
-        ).execute()
-
-        print(f"\nCleaned up test data older than {cutoff_time.isoformat()}")
-    except Exception as e:
-        print(f"\nWarning: Failed to cleanup old test data: {e}")
-
-    yield
-
-    # No cleanup after - individual fixtures handle their own cleanup
@@ -0,0 +1,45 @@
+"""
+Fixtures for integration tests (live FastAPI app + Supabase).
+
+Shared fixtures (test client, users, workspaces) live in tests/conftest.py;
+the session cleanup here only runs when integration tests are collected.
+"""
+
+import pytest
+from supabase import Client
+
+
+# =============================================================================
+# CLEANUP FIXTURES
+# =============================================================================
+
+@pytest.fixture(scope="session", autouse=True)
+def cleanup_old_test_data(supabase_client: Client):
+    """
+    Clean up old test data before test session starts.
+
+    Removes test users and workspaces older than 1 hour.
+    Scope: session (runs once before the integration tests)
+    """
+    from datetime import datetime, timedelta
+
+    cutoff_time = datetime.utcnow() - timedelta(hours=1)
+
+    try:
+        # Clean up old test workspaces
+        supabase_client.table("workspaces").delete().like("name", "Test Workspace%").lt(
+            "created_at", cutoff_time.isoformat()
+        ).execute()
+
+        # Clean up old test users
+        supabase_client.table("users").delete().like("email", "%@example.com").lt(
+            "created_at", cutoff_time.isoformat()
+        ).execute()
+
+        print(f"\nCleaned up test data older than {cutoff_time.isoformat()}")
+    except Exception as e:
+        print(f"\nWarning: Failed to cleanup old test data: {e}")
+
+    yield
+
+    # No cleanup after - individual fixtures handle their own cleanup
@@ -0,0 +1,151 @@
+"""
+Unit Tests: Run-Now Execution Claims (NewsletterWorker)
+
+Tests how queued run-now executions reach execute_job:
+- Reaper dispatches queued executions found in the DB
+- Each execution is claimed (queued -> running) before it runs
+- Lost claims, non-queued rows and busy jobs are skipped
+- Double delivery (queue + reaper) runs an execution only once
+
+Critical: Tests invisible worker logic that guards against duplicate sends
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.worker import NewsletterWorker
+
+
+JOB_ID = "job-1"
+
+
+def _execution(execution_id="exec-1", status="queued", test_mode=False):
+    """Build a scheduler_executions row"""
+    return {"id": execution_id, "job_id": JOB_ID, "status": status, "test_mode": test_mode}
+
+
+@pytest.fixture
+def worker():
+    """Create a worker with a mocked database and execute_job"""
+    with patch("backend.worker.SupabaseManager", return_value=MagicMock()):
+        worker = NewsletterWorker()
+    worker.execute_job = AsyncMock()
+    return worker
+
+
+async def _drain(worker: NewsletterWorker):
+    """Wait for all dispatched run-now tasks"""
+    await asyncio.gather(*list(worker._run_now_tasks))
+
+
+class TestReapPendingExecutions:
+    """Test the DB reaper for run-now executions"""
+
+    async def test_dispatches_and_runs_claimed_execution(self, worker):
+        """Should claim a queued execution and run it with the row's test_mode"""
+        row = _execution(test_mode=True)
+        claimed = {**row, "status": "running"}
+        worker.db.get_pending_scheduler_executions.return_value = [row]
+        worker.db.get_scheduler_execution.return_value = row
+        worker.db.claim_scheduler_execution.return_value = claimed
+
+        await worker.reap_pending_executions()
+        await _drain(worker)
+
+        worker.db.claim_scheduler_execution.assert_called_once_with("exec-1")
+        worker.execute_job.assert_awaited_once_with(JOB_ID, execution=claimed, test_mode=True)
+        print(f"✓ Claimed and executed queued execution")
+
+    async def test_lost_claim_skips_execution(self, worker):
+        """Should not run an execution another worker claimed first"""
+        row = _execution()
+        worker.db.get_pending_scheduler_executions.return_value = [row]
+        worker.db.get_scheduler_execution.return_value = row
+        worker.db.claim_scheduler_execution.return_value = None
+
+        await worker.reap_pending_executions()
+        await _drain(worker)
+
+        worker.db.claim_scheduler_execution.assert_called_once_with("exec-1")
+        worker.execute_job.assert_not_awaited()
+        print(f"✓ Skipped execution with lost claim")
+
+    @pytest.mark.parametrize("status", ["running", "completed", "failed"])
+    async def test_non_queued_execution_not_claimed(self, worker, status):
+        """Should not claim an execution that is no longer queued"""
+        row = _execution(status=status)
+        worker.db.get_pending_scheduler_executions.return_value = [row]
+        worker.db.get_scheduler_execution.return_value = row
+
+        await worker.reap_pending_executions()
+        await _drain(worker)
+
+        worker.db.claim_scheduler_execution.assert_not_called()
+        worker.execute_job.assert_not_awaited()
+        print(f"✓ Ignored {status} execution")
+
+    async def test_deleted_execution_not_claimed(self, worker):
+        """Should skip an execution deleted between reap and dispatch"""
+        worker.db.get_pending_scheduler_executions.return_value = [_execution()]
+        worker.db.get_scheduler_execution.return_value = None
+
+        await worker.reap_pending_executions()
+        await _drain(worker)
+
+        worker.db.claim_scheduler_execution.assert_not_called()
+        worker.execute_job.assert_not_awaited()
+        print(f"✓ Ignored deleted execution")
+
+    async def test_busy_job_leaves_execution_queued(self, worker):
+        """Should leave the execution unclaimed while its job runs on this worker"""
+        row = _execution()
+        worker.running_jobs[JOB_ID] = True
+        worker.db.get_pending_scheduler_executions.return_value = [row]
+        worker.db.get_scheduler_execution.return_value = row
+
+        await worker.reap_pending_executions()
+        await _drain(worker)
+
+        worker.db.claim_scheduler_execution.assert_not_called()
+        worker.execute_job.assert_not_awaited()
+        print(f"✓ Left execution queued for busy job")
+
+    async def test_reaper_queries_queued_window(self, worker):
+        """Should query executions started between max age and grace period"""
+        worker.db.get_pending_scheduler_executions.return_value = []
+
+        await worker.reap_pending_executions()
+
+        started_after, started_before = worker.db.get_pending_scheduler_executions.call_args.args
+        assert started_after < started_before
+        print(f"✓ Queried reaper window")
+
+    async def test_reaper_survives_db_error(self, worker):
+        """Should log and swallow database errors"""
+        worker.db.get_pending_scheduler_executions.side_effect = Exception("db down")
+
+        await worker.reap_pending_executions()
+
+        worker.execute_job.assert_not_awaited()
+        print(f"✓ Reaper survived database error")
+
+
+class TestDoubleDelivery:
+    """Test an execution delivered by both the Redis queue and the reaper"""
+
+    async def test_runs_once(self, worker):
+        """Should run the execution once when the second claim fails"""
+        row = _execution()
+        claimed = {**row, "status": "running"}
+        worker.db.get_scheduler_execution.return_value = row
+        worker.db.claim_scheduler_execution.side_effect = [claimed, None]
+
+        worker._dispatch_execution("exec-1", False)
+        worker._dispatch_execution("exec-1", False)
+        await _drain(worker)
+
+        assert worker.db.claim_scheduler_execution.call_count == 2
+        worker.execute_job.assert_awaited_once_with(JOB_ID, execution=claimed, test_mode=False)
+        print(f"✓ Double delivery executed once")
@@ -0,0 +1,193 @@
+"""
+Unit Tests: Email Link Tracking (TrackingService.add_tracking_to_html)
+
+Tests the regex-based href rewriting used on every send:
+- Quoted (double/single) and unquoted href attributes are tracked
+- Special links (mailto:, tel:, #anchors) are left untouched
+- Click payloads carry the UTM-tagged destination and the recipient
+- Tracking pixel is inserted before </body>
+- Precomputed link maps give the same output as the one-shot path
+- Disabled click tracking links straight to the UTM-tagged URL
+
+Critical: Tests invisible backend logic that rewrites every outgoing newsletter
+"""
+
+import re
+
+import pytest
+
+from backend.services.tracking_service import TrackingService
+
+
+NEWSLETTER_ID = "11111111-1111-1111-1111-111111111111"
+WORKSPACE_ID = "22222222-2222-2222-2222-222222222222"
+RECIPIENT = "reader@example.com"
+
+
+@pytest.fixture
+def tracking():
+    """Create a tracking service with click tracking enabled"""
+    service = TrackingService()
+    service.click_tracking_enabled = True
+    return service
+
+
+def _hrefs(html_content: str):
+    """All href values (quoted or unquoted) in document order"""
+    return [
+        quoted if quote else unquoted
+        for quote, quoted, unquoted in re.findall(
+            r"""\shref\s*=\s*(?:(["'])(.*?)\1|([^\s>]+))""", html_content, re.IGNORECASE
+        )
+    ]
+
+
+def _click_payload(tracking: TrackingService, href: str) -> dict:
+    """Decode the tracking payload of a click-redirect href"""
+    assert href.startswith(tracking._click_prefix)
+    return tracking.decode_tracking_params(href[len(tracking._click_prefix):])
+
+
+class TestHrefRewriting:
+    """Test which links are rewritten and how"""
+
+    def test_double_quoted_href_is_tracked(self, tracking):
+        """Should wrap a double-quoted link in the click redirect"""
+        html_content = '<body><a href="https://example.com/post">Read</a></body>'
+
+        tracked = tracking.add_tracking_to_html(html_content, NEWSLETTER_ID, RECIPIENT, WORKSPACE_ID)
+
+        href = _hrefs(tracked)[0]
+        payload = _click_payload(tracking, href)
+        assert payload["r"] == RECIPIENT
+        assert payload["n"] == NEWSLETTER_ID
+        assert payload["w"] == WORKSPACE_ID
+        assert payload["u"].startswith("https://example.com/post?utm_source=newsletter&utm_medium=email")
+        assert f'href="{tracking._click_prefix}' in tracked
+        print(f"✓ Tracked double-quoted href")
+
+    def test_single_quoted_href_keeps_quote_style(self, tracking):
+        """Should track a single-quoted link and keep single quotes"""
+        html_content = "<body><A HREF='https://example.com/a'>A</A></body>"
+
+        tracked = tracking.add_tracking_to_html(html_content, NEWSLETTER_ID, RECIPIENT, WORKSPACE_ID)
+
+        assert f"HREF='{tracking._click_prefix}" in tracked
+        assert _click_payload(tracking, _hrefs(tracked)[0])["u"].startswith("https://example.com/a?")
+        print(f"✓ Tracked single-quoted href")
+
+    def test_unquoted_href_is_tracked_and_quoted(self, tracking):
+        """Should track an unquoted link (entities decoded) and write it back quoted"""
+        html_content = "<body><a class=cta href=https://example.com/x?y=1&amp;z=2>Go</a></body>"
+
+        tracked = tracking.add_tracking_to_html(html_content, NEWSLETTER_ID, RECIPIENT, WORKSPACE_ID)
+
+        assert f'href="{tracking._click_prefix}' in tracked
+        payload = _click_payload(tracking, _hrefs(tracked)[0])
+        assert payload["u"].startswith("https://example.com/x?y=1&z=2&utm_source=newsletter")
+        assert ">Go</a>" in tracked
+        print(f"✓ Tracked unquoted href")
+
+    @pytest.mark.parametrize("href", [
+        '"mailto:editor@example.com"',
+        "'tel:+15550100'",
+        '"#top"',
+        "#section-2",
+    ])
+    def test_special_links_untouched(self, tracking, href):
+        """Should leave mailto:, tel: and in-page anchors as they are"""
+        html_content = f"<body><a href={href}>x</a></body>"
+
+        tracked = tracking.add_tracking_to_html(html_content, NEWSLETTER_ID, RECIPIENT, WORKSPACE_ID)
+
+        assert f"<a href={href}>x</a>" in tracked
+        assert tracking._click_prefix not in tracked
+        print(f"✓ Left {href} untouched")
+
+    def test_only_anchor_hrefs_change(self, tracking):
+        """Should not touch <link href> or text that merely looks like an href"""
+        html_content = (
+            '<head><link href="https://cdn.example.com/s.css" rel="stylesheet"></head>'
+            '<body><p>Use href="https://example.com" in HTML</p>'
+            '<a data-href="https://example.com/d" href="https://example.com/real">r</a></body>'
+        )
+
+        tracked = tracking.add_tracking_to_html(html_content, NEWSLETTER_ID, RECIPIENT, WORKSPACE_ID)
+
+        assert '<link href="https://cdn.example.com/s.css"' in tracked
+        assert '<p>Use href="https://example.com" in HTML</p>' in tracked
+        assert 'data-href="https://example.com/d"' in tracked
+        assert _click_payload(tracking, _hrefs(tracked)[-1])["u"].startswith("https://example.com/real?")
+        print(f"✓ Only <a href> values rewritten")
+
+    def test_content_item_id_attached(self, tracking):
+        """Should attach the content item ID for links to known content"""
+        html_content = '<body><a href="https://example.com/story">Story</a></body>'
+        content_items = [{"id": "33333333-3333-3333-3333-333333333333", "source_url": "https://example.com/story"}]
+
+        tracked = tracking.add_tracking_to_html(
+            html_content, NEWSLETTER_ID, RECIPIENT, WORKSPACE_ID, content_items=content_items
+        )
+
+        payload = _click_payload(tracking, _hrefs(tracked)[0])
+        assert payload["c"] == "33333333-3333-3333-3333-333333333333"
+        assert "utm_content=33333333" in payload["u"]
+        print(f"✓ Attached content item ID")
+
+
+class TestTrackingPixel:
+    """Test open-tracking pixel placement"""
+
+    def test_pixel_before_body_close(self, tracking):
+        """Should insert the pixel right before </body>"""
+        html_content = "<html><body><p>Hi</p></body></html>"
+
+        tracked = tracking.add_tracking_to_html(html_content, NEWSLETTER_ID, RECIPIENT, WORKSPACE_ID)
+
+        assert re.search(r'<img alt="" height="1" src="[^"]+/track/pixel/[^"]+\.png"[^>]*/></body></html>$', tracked)
+        print(f"✓ Inserted pixel before </body>")
+
+    def test_pixel_appended_without_body(self, tracking):
+        """Should append the pixel when there is no body tag"""
+        tracked = tracking.add_tracking_to_html("<p>Hi</p>", NEWSLETTER_ID, RECIPIENT, WORKSPACE_ID)
+
+        assert tracked.startswith("<p>Hi</p><img ")
+        print(f"✓ Appended pixel without body")
+
+
+class TestPrecomputedLinkMap:
+    """Test the per-newsletter link map used by delivery"""
+
+    def test_link_map_matches_one_shot_output(self, tracking):
+        """Should produce identical HTML with or without a precomputed link map"""
+        html_content = (
+            '<body><a href="https://example.com/a">A</a>'
+            "<a href=https://example.com/b>B</a>"
+            '<a href="mailto:x@example.com">M</a></body>'
+        )
+
+        link_map = tracking.precompute_link_map(html_content, NEWSLETTER_ID)
+        with_map = tracking.add_tracking_to_html(
+            html_content, NEWSLETTER_ID, RECIPIENT, WORKSPACE_ID, link_map=link_map
+        )
+        without_map = tracking.add_tracking_to_html(html_content, NEWSLETTER_ID, RECIPIENT, WORKSPACE_ID)
+
+        assert set(link_map) == {"https://example.com/a", "https://example.com/b"}
+        assert with_map == without_map
+        print(f"✓ Link map output matches one-shot output")
+
+
+class TestClickTrackingDisabled:
+    """Test sends with ENABLE_CLICK_TRACKING off"""
+
+    def test_click_tracking_disabled_uses_utm_url(self, tracking):
+        """Should link straight to the UTM-tagged URL when click tracking is off"""
+        tracking.click_tracking_enabled = False
+        html_content = '<body><a href="https://example.com/post">Read</a></body>'
+
+        tracked = tracking.add_tracking_to_html(html_content, NEWSLETTER_ID, RECIPIENT, WORKSPACE_ID)
+
+        assert _hrefs(tracked)[0] == (
+            "https://example.com/post?utm_source=newsletter&amp;utm_medium=email&amp;utm_campaign=11111111"
+        )
+        print(f"✓ Used UTM URL without click redirect")
@@ -0,0 +1,270 @@
+"""
+Unit Tests: Trend Detection Helpers (TrendDetectionService)
+
+Tests the sparse-matrix helpers behind trend velocity and deduplication:
+- Keyword mention counting per window (n-gram matching, one count per item)
+- Velocity from current vs historical mentions
+- Topic merging by name and keyword overlap (transitive)
+- Current/historical windows fetched as separate range queries
+- Topic extraction with items that have no analyzer terms
+
+Critical: Tests invisible backend logic that decides which trends are shown
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from scipy.sparse import csr_matrix
+
+from backend.services.trend_service import TrendDetectionService
+
+
+@pytest.fixture
+def service():
+    """Create a trend service with a mocked database"""
+    return TrendDetectionService(db=MagicMock())
+
+
+def _incidence(topic_keywords):
+    """Build keyword ids and the keyword x topic matrix for lists of keywords"""
+    keyword_ids, rows, cols = {}, [], []
+    for topic_idx, keywords in enumerate(topic_keywords):
+        for kw in keywords:
+            rows.append(keyword_ids.setdefault(kw, len(keyword_ids)))
+            cols.append(topic_idx)
+    matrix = csr_matrix(
+        (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+        shape=(len(keyword_ids), len(topic_keywords))
+    )
+    return keyword_ids, matrix
+
+
+def _items(*titles):
+    """Build content items from titles"""
+    return [{'title': title} for title in titles]
+
+
+def _topic(name, keywords, velocity=0.0, mention_count=1, sources=('reddit',)):
+    """Build a topic dict as produced by extraction + velocity"""
+    return {
+        'topic': name,
+        'keywords': list(keywords),
+        'items': [{'title': name}],
+        'velocity': velocity,
+        'mention_count': mention_count,
+        'sources': set(sources),
+        'source_count': len(sources),
+    }
+
+
+class TestCountKeywordMentions:
+    """Test per-window keyword mention counting"""
+
+    def test_counts_items_per_window(self, service):
+        """Should count matching items separately for each window"""
+        keyword_ids, keyword_topics = _incidence([['rust'], ['python']])
+        current = _items("Rust 2.0 released", "Why Rust is fast", "Python tips")
+        historical = _items("Python packaging", "Gardening news")
+
+        current_counts, historical_counts = service._count_keyword_mentions(
+            [current, historical], keyword_ids, keyword_topics
+        )
+
+        assert current_counts.tolist() == [2, 1]
+        assert historical_counts.tolist() == [0, 1]
+        print(f"✓ Counted mentions per window")
+
+    def test_item_counts_once_per_topic(self, service):
+        """Should count an item once even when it matches several topic keywords"""
+        keyword_ids, keyword_topics = _incidence([['openai', 'chatgpt', 'atlas']])
+        items = _items("OpenAI launches ChatGPT Atlas browser")
+
+        (counts,) = service._count_keyword_mentions([items], keyword_ids, keyword_topics)
+
+        assert counts.tolist() == [1]
+        print(f"✓ Counted item once per topic")
+
+    def test_matches_whole_terms_and_ngrams(self, service):
+        """Should match analyzer terms and n-grams, not substrings"""
+        keyword_ids, keyword_topics = _incidence([['machine learning'], ['ai']])
+        items = _items("Machine learning at scale", "Learning machine repair", "Fair pricing")
+
+        (counts,) = service._count_keyword_mentions([items], keyword_ids, keyword_topics)
+
+        assert counts.tolist() == [1, 0]
+        print(f"✓ Matched n-grams and whole terms only")
+
+    def test_no_keywords(self, service):
+        """Should return zero counts when there are no keywords"""
+        keyword_topics = csr_matrix((0, 2), dtype=np.int32)
+
+        counts = service._count_keyword_mentions([_items("a"), []], {}, keyword_topics)
+
+        assert [c.tolist() for c in counts] == [[0, 0], [0, 0]]
+        print(f"✓ Handled empty keyword set")
+
+
+class TestCalculateVelocity:
+    """Test mention velocity from the two windows"""
+
+    def test_velocity_values(self, service):
+        """Should compute percentage change, 100 for new topics, 0 for absent ones"""
+        topics = [
+            {'keywords': ['rust']},
+            {'keywords': ['python']},
+            {'keywords': ['cobol']},
+        ]
+        current = _items("Rust news", "Rust again", "Python news")
+        historical = _items("Python old", "Python older", "Rust once")
+
+        result = service._calculate_velocity(topics, current, historical)
+
+        assert [t['mention_count'] for t in result] == [2, 1, 0]
+        assert [t['velocity'] for t in result] == [100.0, -50.0, 0.0]
+        print(f"✓ Calculated velocities")
+
+    def test_new_topic_velocity(self, service):
+        """Should give a topic with no history a velocity of 100"""
+        topics = [{'keywords': ['Atlas']}]
+
+        result = service._calculate_velocity(topics, _items("Atlas browser"), [])
+
+        assert result[0]['velocity'] == 100.0
+        print(f"✓ New topic velocity is 100")
+
+
+class TestMergeSimilarTopics:
+    """Test topic deduplication"""
+
+    def test_single_topic_unchanged(self, service):
+        """Should return a single topic as-is"""
+        topics = [_topic("Rust", ['rust'])]
+
+        assert service._merge_similar_topics(topics) is topics
+        print(f"✓ Single topic unchanged")
+
+    def test_merge_by_name(self, service):
+        """Should merge topics whose names match case-insensitively"""
+        topics = [
+            _topic("OpenAI", ['openai'], velocity=10.0, mention_count=2, sources=('reddit',)),
+            _topic("openai ", ['gpt'], velocity=50.0, mention_count=3, sources=('rss',)),
+        ]
+
+        merged = service._merge_similar_topics(topics)
+
+        assert len(merged) == 1
+        assert merged[0]['topic'] == "openai "  # highest velocity names the topic
+        assert merged[0]['velocity'] == 10.0  # velocity stays the first member's
+        assert merged[0]['mention_count'] == 5
+        assert merged[0]['sources'] == {'reddit', 'rss'}
+        assert merged[0]['source_count'] == 2
+        assert len(merged[0]['items']) == 2
+        print(f"✓ Merged topics by name")
+
+    def test_merge_by_keyword_overlap(self, service):
+        """Should merge topics with Jaccard >= threshold and enough shared keywords"""
+        topics = [
+            _topic("A", ['a', 'b', 'c'], velocity=20.0),
+            _topic("B", ['a', 'b', 'c', 'd'], velocity=20.0),
+        ]
+
+        merged = service._merge_similar_topics(topics)
+
+        assert len(merged) == 1
+        assert merged[0]['topic'] == "A"  # velocity tie goes to the earliest
+        assert merged[0]['keywords'] == ['a', 'b', 'c', 'd']
+        print(f"✓ Merged topics by keyword overlap")
+
+    def test_low_overlap_not_merged(self, service):
+        """Should keep topics apart when overlap is below the threshold"""
+        topics = [
+            _topic("A", ['a', 'b', 'c']),
+            _topic("B", ['a', 'b', 'x', 'y']),
+        ]
+
+        merged = service._merge_similar_topics(topics)
+
+        assert [t['topic'] for t in merged] == ["A", "B"]
+        print(f"✓ Kept low-overlap topics apart")
+
+    def test_merge_is_transitive(self, service):
+        """Should merge A~B and B~C into one topic even though A and C are below threshold"""
+        topics = [
+            _topic("A", ['a', 'b', 'c'], velocity=5.0),
+            _topic("Other", ['x', 'y'], velocity=99.0),
+            _topic("B", ['a', 'b', 'c', 'd'], velocity=30.0),
+            _topic("C", ['a', 'b', 'c', 'd', 'e'], velocity=10.0),
+        ]
+
+        merged = service._merge_similar_topics(topics)
+
+        assert [t['topic'] for t in merged] == ["B", "Other"]
+        assert merged[0]['keywords'] == ['a', 'b', 'c', 'd', 'e']
+        assert merged[0]['velocity'] == 5.0
+        assert merged[0]['mention_count'] == 3
+        assert len(merged[0]['items']) == 3
+        print(f"✓ Merged topics transitively")
+
+    def test_merged_topic_keeps_first_member_scores(self, service):
+        """Should keep the first member's velocity and recency boost, taking only the name from the fastest"""
+        first = {**_topic("Slow", ['a', 'b', 'c'], velocity=5.0), 'recency_boost': 1.0}
+        second = {**_topic("Fast", ['a', 'b', 'c'], velocity=80.0), 'recency_boost': 1.5}
+
+        merged = service._merge_similar_topics([first, second])
+
+        assert len(merged) == 1
+        assert merged[0]['topic'] == "Fast"
+        assert merged[0]['velocity'] == 5.0
+        assert merged[0]['recency_boost'] == 1.0
+        assert first['topic'] == "Slow"  # inputs are not modified
+        print(f"✓ Merged topic keeps first member's scores")
+
+
+class TestDetectTrendsWindows:
+    """Test the current/historical content fetch"""
+
+    async def test_fetches_windows_separately(self, service):
+        """Should query the current window and the 30-day baseline as separate ranges"""
+        service.db.list_content_items.return_value = []
+
+        await service.detect_trends(uuid4(), days_back=7)
+
+        calls = [c.kwargs for c in service.db.list_content_items.call_args_list]
+        assert len(calls) == 2
+        current = next(c for c in calls if c['end_date'] is None)
+        historical = next(c for c in calls if c['end_date'] is not None)
+        assert historical['end_date'] == current['start_date']
+        assert current['start_date'] - historical['start_date'] == timedelta(days=30)
+        assert all(c['limit'] == 1000 for c in calls)
+        print(f"✓ Fetched current and historical windows separately")
+
+
+class TestExtractTopics:
+    """Test clustering with items that produce no features"""
+
+    TITLES = [
+        "OpenAI releases GPT model update", "GPT model update from OpenAI", "OpenAI GPT model benchmark",
+        "Rust compiler release notes", "Rust compiler gets faster", "Rust compiler release speedup",
+        "Python packaging tools", "Python packaging news", "Python packaging guide", "Python packaging tools guide",
+    ]
+
+    @pytest.mark.parametrize("title", ["🔥🔥", "The", ""])
+    def test_term_less_item_does_not_drop_topics(self, service, title):
+        """Should cluster the other items when one has no analyzer terms"""
+        now = datetime.now(timezone.utc)
+        items = [
+            {'title': t, 'source': 'rss', 'created_at': now.isoformat()}
+            for t in self.TITLES
+        ]
+        noise = {'title': title, 'source': 'x', 'created_at': now.isoformat()}
+
+        baseline = service._extract_topics(items, now)
+        topics = service._extract_topics(items + [noise], now)
+
+        assert len(baseline) > 0
+        assert len(topics) == len(baseline)
+        assert all(noise not in topic['items'] for topic in topics)
+        print(f"✓ Clustered around term-less item {title!r}")
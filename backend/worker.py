@@ -4,16 +4,24 @@ Background Worker for Scheduler Job Execution.
 This worker:
 - Monitors active scheduled jobs
 - Executes jobs at scheduled times
+- Executes run-now requests from the Redis queue (with a DB reaper fallback)
 - Updates execution records with results
 - Handles errors and retries
 """
 
 import asyncio
+import json
 import logging
-from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional
+from datetime import datetime, timezone, timedelta
+from typing import Dict, Any, List, Optional, Set
 import traceback
 
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    # redis not installed - run-now executions are picked up by the DB reaper only
+    aioredis = None
+
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.date import DateTrigger
@@ -22,6 +30,7 @@ from src.ai_newsletter.database.supabase_client import SupabaseManager
 from backend.services.content_service import content_service
 from backend.services.newsletter_service import newsletter_service
 from backend.services.delivery_service import delivery_service
+from backend.config.constants import SchedulerConstants
 
 # Configure logging
 logging.basicConfig(
@@ -39,6 +48,9 @@ class NewsletterWorker:
         self.scheduler = AsyncIOScheduler(timezone='UTC')
         self.db = SupabaseManager()
         self.running_jobs: Dict[str, bool] = {}  # Track running executions
+        self.redis = None
+        self._queue_consumer: Optional[asyncio.Task] = None
+        self._run_now_tasks: Set[asyncio.Task] = set()  # Keep references to in-flight run-now tasks
 
     async def start(self):
         """Start the worker and load all active jobs."""
@@ -74,6 +86,26 @@ class NewsletterWorker:
         )
         logger.info("Scheduled daily historical content cleanup (3:00 AM UTC)")
 
+        # Run-now requests: consume the Redis queue if configured
+        if aioredis is not None and SchedulerConstants.REDIS_URL:
+            self.redis = aioredis.from_url(SchedulerConstants.REDIS_URL)
+            self._queue_consumer = asyncio.create_task(self.consume_run_now_queue())
+        else:
+            logger.info("REDIS_URL not configured - run-now requests handled by DB reaper only")
+
+        # Reaper: re-dispatch run-now executions the queue never delivered
+        self.scheduler.add_job(
+            self.reap_pending_executions,
+            trigger='interval',
+            seconds=SchedulerConstants.RUN_NOW_REAPER_INTERVAL_SECONDS,
+            id='reap_pending_executions',
+            replace_existing=True
+        )
+        logger.info(
+            f"Scheduled pending execution reaper "
+            f"(every {SchedulerConstants.RUN_NOW_REAPER_INTERVAL_SECONDS}s)"
+        )
+
         logger.info("=" * 70)
         logger.info("Worker is ready and monitoring scheduled jobs")
         logger.info("=" * 70)
@@ -196,8 +228,20 @@ class NewsletterWorker:
                 timezone=timezone
             )
 
-    async def execute_job(self, job_id: str):
-        """Execute a scheduled job."""
+    async def execute_job(
+        self,
+        job_id: str,
+        execution: Optional[Dict[str, Any]] = None,
+        test_mode: Optional[bool] = None
+    ):
+        """
+        Execute a scheduled job.
+
+        Args:
+            job_id: Job ID to execute
+            execution: Existing execution record (run-now requests); created if omitted
+            test_mode: Override for skipping email sending (defaults to job config)
+        """
         # Prevent concurrent executions
         if self.running_jobs.get(job_id):
             logger.warning(f"Job {job_id} is already running, skipping")
@@ -215,15 +259,16 @@ class NewsletterWorker:
 
             logger.info(f"Executing job: {job['name']} ({job_id})")
 
-            # Create execution record
-            execution_data = {
-                'job_id': job_id,
-                'workspace_id': job['workspace_id'],
-                'status': 'running',
-                'actions_performed': [],
-                'started_at': datetime.now(timezone.utc).isoformat()
-            }
-            execution = self.db.create_scheduler_execution(execution_data)
+            # Create execution record (run-now requests already have one)
+            if execution is None:
+                execution_data = {
+                    'job_id': job_id,
+                    'workspace_id': job['workspace_id'],
+                    'status': 'running',
+                    'actions_performed': [],
+                    'started_at': datetime.now(timezone.utc).isoformat()
+                }
+                execution = self.db.create_scheduler_execution(execution_data)
             execution_id = execution['id']
 
             # Update job status
@@ -264,7 +309,8 @@ class NewsletterWorker:
 
             # Action 3: Send newsletter
             if 'send' in actions and newsletter_id:
-                test_mode = config.get('test_mode', False)
+                if test_mode is None:
+                    test_mode = config.get('test_mode', False)
                 logger.info(f"  [3/3] Sending newsletter (test_mode: {test_mode})...")
                 send_result = await self._send_newsletter(
                     workspace_id,
@@ -338,6 +384,89 @@ class NewsletterWorker:
         finally:
             self.running_jobs[job_id] = False
 
+    async def consume_run_now_queue(self):
+        """Execute run-now requests as soon as the API pushes them onto Redis."""
+        queue_key = SchedulerConstants.RUN_NOW_QUEUE_KEY
+        logger.info(f"Listening for run-now requests on Redis list '{queue_key}'")
+
+        while True:
+            try:
+                item = await self.redis.brpop(
+                    queue_key,
+                    timeout=SchedulerConstants.RUN_NOW_QUEUE_BLOCK_SECONDS
+                )
+                if not item:
+                    continue
+
+                _, payload = item
+                request = json.loads(payload)
+                self._dispatch_execution(request['execution_id'], request.get('test_mode', False))
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Redis outage: back off, the DB reaper covers anything missed meanwhile
+                logger.error(f"Run-now queue consumer error: {e}")
+                await asyncio.sleep(5)
+
+    def _dispatch_execution(self, execution_id: str, test_mode: bool):
+        """Run a queued execution in the background without blocking the consumer."""
+        task = asyncio.create_task(self.execute_queued_execution(execution_id, test_mode))
+        self._run_now_tasks.add(task)
+        task.add_done_callback(self._run_now_tasks.discard)
+
+    async def execute_queued_execution(self, execution_id: str, test_mode: bool = False):
+        """
+        Claim and execute a run-now request for an existing execution record.
+
+        The claim (queued -> running) is a single conditional UPDATE, so an
+        execution delivered twice (queue + reaper, or two worker replicas)
+        runs only once.
+        """
+        execution = self.db.get_scheduler_execution(execution_id)
+        if not execution or execution['status'] != 'queued':
+            # Already claimed (e.g. by another worker) or deleted with its job
+            return
+
+        if self.running_jobs.get(execution['job_id']):
+            # Job busy on this worker: leave the execution queued for the reaper
+            return
+
+        claimed = self.db.claim_scheduler_execution(execution_id)
+        if not claimed:
+            return
+
+        logger.info(f"Executing run-now request {execution_id}")
+        await self.execute_job(
+            claimed['job_id'],
+            execution=claimed,
+            test_mode=claimed.get('test_mode', test_mode)
+        )
+
+    async def reap_pending_executions(self):
+        """
+        Re-dispatch run-now executions that never reached the worker via Redis.
+
+        Only queued (unclaimed) executions are picked up; dispatch still goes
+        through the claim, so a row another worker takes meanwhile is skipped.
+        """
+        try:
+            now = datetime.now(timezone.utc)
+            started_before = now - timedelta(seconds=SchedulerConstants.RUN_NOW_REAPER_GRACE_SECONDS)
+            started_after = now - timedelta(seconds=SchedulerConstants.RUN_NOW_REAPER_MAX_AGE_SECONDS)
+
+            pending = self.db.get_pending_scheduler_executions(
+                started_after.isoformat(),
+                started_before.isoformat()
+            )
+
+            for execution in pending:
+                logger.info(f"Reaper dispatching pending execution {execution['id']}")
+                self._dispatch_execution(execution['id'], execution.get('test_mode', False))
+
+        except Exception as e:
+            logger.error(f"Pending execution reaper failed: {e}")
+
     async def _scrape_content(self, workspace_id: str, config: Dict[str, Any]) -> Dict[str, Any]:
         """Scrape content for newsletter."""
         try:
@@ -440,7 +569,11 @@ class NewsletterWorker:
     async def stop(self):
         """Stop the worker gracefully."""
         logger.info("Stopping worker...")
+        if self._queue_consumer:
+            self._queue_consumer.cancel()
         self.scheduler.shutdown(wait=True)
+        if self.redis is not None:
+            await self.redis.aclose()
         logger.info("Worker stopped")
 
     async def run(self):
@@ -1,7 +1,7 @@
 export type ScheduleType = 'daily' | 'weekly' | 'custom' | 'cron';
 export type JobStatus = 'active' | 'paused' | 'disabled';
 export type JobAction = 'scrape' | 'generate' | 'send';
-export type ExecutionStatus = 'pending' | 'running' | 'completed' | 'failed' | 'partial';
+export type ExecutionStatus = 'pending' | 'queued' | 'running' | 'completed' | 'failed' | 'partial';
 
 export interface SchedulerJobCreate {
   workspace_id: string;
@@ -4,10 +4,12 @@ Supabase client manager for CreatorPulse.
 Provides a unified interface for all database operations.
 """
 
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime, timedelta, timezone
 from supabase import create_client, Client
+import copy
 import os
+import time
 from pathlib import Path
 
 # Load environment variables from .env
@@ -25,6 +27,14 @@ from ..models.feedback import FeedbackItem
 from ..models.analytics import EmailEvent
 
 
+# workspace_id -> (expires_at, workspace data). Module-level so every
+# SupabaseManager in the process shares it, and a write through any of them
+# invalidates the entry for all. Other processes (e.g. the worker) keep their
+# own cache, so they may see a workspace update up to
+# SupabaseManager.WORKSPACE_CACHE_TTL_SECONDS late.
+_workspace_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
 class SupabaseManager:
     """
     Central manager for all Supabase operations.
@@ -36,6 +46,11 @@ class SupabaseManager:
     - Query optimization
     """
 
+    # Short-lived workspace cache (see _workspace_cache): workspaces are effectively
+    # immutable within a request, but nested service calls look the same one up repeatedly
+    WORKSPACE_CACHE_TTL_SECONDS = 10
+    WORKSPACE_CACHE_MAX_SIZE = 1024
+
     def __init__(self):
         """Initialize Supabase client."""
         # Load .env to ensure environment variables are available
@@ -141,7 +156,11 @@ class SupabaseManager:
         return result.data
 
     def get_workspace(self, workspace_id: str) -> Optional[Dict[str, Any]]:
-        """Get workspace by ID."""
+        """Get workspace by ID (cached for a few seconds; callers get their own copy)."""
+        cached = _workspace_cache.get(workspace_id)
+        if cached and cached[0] > time.monotonic():
+            return copy.deepcopy(cached[1])
+
         try:
             result = self.service_client.table('workspaces') \
                 .select('*') \
@@ -149,7 +168,11 @@ class SupabaseManager:
                 .maybe_single() \
                 .execute()
 
-            return result.data if result.data else None
+            if not result.data:
+                return None
+
+            self._cache_workspace(workspace_id, result.data)
+            return result.data
         except Exception as e:
             # Log the error for debugging
             error_str = str(e).lower()
@@ -163,6 +186,16 @@ class SupabaseManager:
             # Return None to maintain backwards compatibility but log the issue
             return None
 
+    def _cache_workspace(self, workspace_id: str, workspace: Dict[str, Any]) -> None:
+        """Store a private copy of workspace in the TTL cache, evicting the oldest entry when full."""
+        if len(_workspace_cache) >= self.WORKSPACE_CACHE_MAX_SIZE:
+            _workspace_cache.pop(next(iter(_workspace_cache)), None)
+
+        _workspace_cache[workspace_id] = (
+            time.monotonic() + self.WORKSPACE_CACHE_TTL_SECONDS,
+            copy.deepcopy(workspace)
+        )
+
     def user_has_workspace_access(self, user_id: str, workspace_id: str) -> bool:
         """Check if user has access to workspace."""
         result = self.service_client.table('user_workspaces') \
@@ -177,6 +210,7 @@ class SupabaseManager:
                         workspace_id: str,
                         updates: Dict[str, Any]) -> Dict[str, Any]:
         """Update workspace details."""
+        _workspace_cache.pop(workspace_id, None)
         updates['updated_at'] = datetime.now().isoformat()
 
         result = self.service_client.table('workspaces') \
@@ -188,6 +222,7 @@ class SupabaseManager:
 
     def delete_workspace(self, workspace_id: str) -> bool:
         """Delete workspace (cascade deletes all related data)."""
+        _workspace_cache.pop(workspace_id, None)
         result = self.service_client.table('workspaces') \
             .delete() \
             .eq('id', workspace_id) \
@@ -1271,6 +1306,54 @@ class SupabaseManager:
 
         return result.data
 
+    def list_scheduler_jobs_for_user(self, user_id: str, workspace_id: str) -> List[Dict[str, Any]]:
+        """
+        List jobs for workspace using database function (access check included).
+
+        Args:
+            user_id: User ID requesting the list
+            workspace_id: Workspace ID to filter jobs
+
+        Returns:
+            List of job data (empty if user is not a workspace member)
+        """
+        try:
+            result = self.service_client.rpc('list_jobs_for_user', {
+                'p_user_id': user_id,
+                'p_workspace_id': workspace_id
+            }).execute()
+
+            return result.data or []
+        except Exception:
+            # Fallback: separate membership check + table query
+            if not self.user_has_workspace_access(user_id, workspace_id):
+                return []
+            return self.list_scheduler_jobs(workspace_id)
+
+    def get_next_scheduled_job(self, workspace_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the enabled job with the earliest next_run_at for a workspace.
+
+        Lets the database pick the row (ORDER BY next_run_at LIMIT 1) instead
+        of loading every job and scanning for the minimum in Python.
+
+        Args:
+            workspace_id: Workspace ID to filter jobs
+
+        Returns:
+            Job data, or None if no enabled job has a next run scheduled
+        """
+        result = self.service_client.table('scheduler_jobs') \
+            .select('*') \
+            .eq('workspace_id', workspace_id) \
+            .eq('is_enabled', True) \
+            .not_.is_('next_run_at', 'null') \
+            .order('next_run_at') \
+            .limit(1) \
+            .execute()
+
+        return result.data[0] if result.data else None
+
     def update_scheduler_job(self,
                             job_id: str,
                             updates: Dict[str, Any]) -> Dict[str, Any]:
@@ -1284,6 +1367,70 @@ class SupabaseManager:
 
         return result.data[0]
 
+    def update_scheduler_job_for_user(
+        self,
+        user_id: str,
+        job_id: str,
+        updates: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update job in one statement using database function (access check included).
+
+        Args:
+            user_id: User ID updating the job
+            job_id: Job ID to update
+            updates: Fields to update (only keys present are written)
+
+        Returns:
+            Updated job data, or None if job not found or user is not a workspace member
+        """
+        return self._write_scheduler_job_for_user(
+            'update_scheduler_job_for_user',
+            {'p_user_id': user_id, 'p_job_id': job_id, 'p_updates': updates},
+            user_id,
+            job_id,
+            updates
+        )
+
+    def pause_scheduler_job_for_user(self, user_id: str, job_id: str) -> Optional[Dict[str, Any]]:
+        """Pause job in one statement (None if not found or access denied)."""
+        return self._write_scheduler_job_for_user(
+            'pause_scheduler_job',
+            {'p_user_id': user_id, 'p_job_id': job_id},
+            user_id,
+            job_id,
+            {'status': 'paused', 'is_enabled': False}
+        )
+
+    def resume_scheduler_job_for_user(self, user_id: str, job_id: str) -> Optional[Dict[str, Any]]:
+        """Resume job in one statement (None if not found or access denied)."""
+        return self._write_scheduler_job_for_user(
+            'resume_scheduler_job',
+            {'p_user_id': user_id, 'p_job_id': job_id},
+            user_id,
+            job_id,
+            {'status': 'active', 'is_enabled': True}
+        )
+
+    def _write_scheduler_job_for_user(
+        self,
+        function_name: str,
+        params: Dict[str, Any],
+        user_id: str,
+        job_id: str,
+        updates: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Run an access-checked job UPDATE function, falling back to read-then-write."""
+        try:
+            result = self.service_client.rpc(function_name, params).execute()
+            return result.data[0] if result.data else None
+        except Exception:
+            # Fallback: job lookup + membership check + update
+            job = self.get_scheduler_job(job_id)
+            if not job or not self.user_has_workspace_access(user_id, job['workspace_id']):
+                return None
+            return self.update_scheduler_job(job_id, dict(updates))
+
     def delete_scheduler_job(self, job_id: str) -> bool:
         """Delete job."""
         result = self.service_client.table('scheduler_jobs') \
@@ -1317,6 +1464,68 @@ class SupabaseManager:
 
         return result.data[0]
 
+    def get_scheduler_execution(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        """Get execution record by ID."""
+        result = self.service_client.table('scheduler_executions') \
+            .select('*') \
+            .eq('id', execution_id) \
+            .maybe_single() \
+            .execute()
+
+        return result.data if result and result.data else None
+
+    def claim_scheduler_execution(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Atomically move a queued execution to running.
+
+        One conditional UPDATE (WHERE status = 'queued'), so when several
+        workers race for the same execution exactly one gets the row back.
+
+        Args:
+            execution_id: Execution record ID
+
+        Returns:
+            Claimed execution record, or None if it was already claimed or no longer exists
+        """
+        result = self.service_client.table('scheduler_executions') \
+            .update({
+                'status': 'running',
+                'started_at': datetime.now(timezone.utc).isoformat()
+            }) \
+            .eq('id', execution_id) \
+            .eq('status', 'queued') \
+            .execute()
+
+        return result.data[0] if result.data else None
+
+    def get_pending_scheduler_executions(
+        self,
+        started_after: str,
+        started_before: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Get run-now executions still waiting in the queued state within a time window.
+
+        Used by the worker to re-dispatch run-now executions that never
+        reached it through the queue.
+
+        Args:
+            started_after: ISO timestamp lower bound for started_at
+            started_before: ISO timestamp upper bound for started_at
+
+        Returns:
+            List of execution records, oldest first
+        """
+        result = self.service_client.table('scheduler_executions') \
+            .select('*') \
+            .eq('status', 'queued') \
+            .gte('started_at', started_after) \
+            .lt('started_at', started_before) \
+            .order('started_at') \
+            .execute()
+
+        return result.data or []
+
     def get_scheduler_executions(self,
                                 job_id: str,
                                 limit: int = 50) -> List[Dict[str, Any]]:
@@ -1330,6 +1539,68 @@ class SupabaseManager:
 
         return result.data
 
+    def get_scheduler_executions_for_user(
+        self,
+        user_id: str,
+        job_id: str,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """
+        Get execution history for a job using database function (access check included).
+
+        Args:
+            user_id: User ID requesting history
+            job_id: Job ID
+            limit: Maximum number of executions to return
+
+        Returns:
+            List of execution records (empty if user is not a workspace member)
+        """
+        try:
+            result = self.service_client.rpc('list_executions_for_user', {
+                'p_user_id': user_id,
+                'p_job_id': job_id,
+                'p_limit': limit
+            }).execute()
+
+            return result.data or []
+        except Exception:
+            # Fallback: separate job lookup + membership check + table query
+            job = self.get_scheduler_job(job_id)
+            if not job or not self.user_has_workspace_access(user_id, job['workspace_id']):
+                return []
+            return self.get_scheduler_executions(job_id, limit)
+
+    def get_scheduler_avg_duration(self, job_id: str, limit: int = 10) -> Optional[float]:
+        """
+        Get average duration of a job's most recent executions using database function.
+
+        Args:
+            job_id: Job ID
+            limit: Number of most recent executions to average over
+
+        Returns:
+            Average duration in seconds, or None if no execution has a duration
+        """
+        try:
+            result = self.service_client.rpc('get_scheduler_avg_duration', {
+                'job_uuid': job_id,
+                'limit_count': limit
+            }).execute()
+
+            return float(result.data) if result.data is not None else None
+        except Exception:
+            # Fallback: fetch only the duration column and average here
+            result = self.service_client.table('scheduler_executions') \
+                .select('duration_seconds') \
+                .eq('job_id', job_id) \
+                .order('started_at', desc=True) \
+                .limit(limit) \
+                .execute()
+
+            durations = [row['duration_seconds'] for row in result.data or [] if row['duration_seconds']]
+            return sum(durations) / len(durations) if durations else None
+
     def get_workspace_recent_executions(
         self,
         workspace_id: str,
@@ -1339,23 +1610,72 @@ class SupabaseManager:
         Get recent execution history across all jobs in workspace.
 
         Used for dashboard activity feed.
-        Ordered by most recent first.
+        Ordered by most recent first. Only the counters the feed displays are
+        read out of the scrape_result/send_result JSONB documents.
 
         Args:
             workspace_id: Workspace ID to filter executions
             limit: Maximum number of executions to return (default: 10)
 
         Returns:
-            List of execution records
+            List of execution records (id, status, started_at, actions_performed,
+            items_count, sources_count, recipients_count)
         """
         result = self.service_client.table('scheduler_executions') \
-            .select('*') \
+            .select(
+                'id, status, started_at, actions_performed, '
+                'items_count:scrape_result->items_count, '
+                'sources:scrape_result->sources, '
+                'recipients_count:send_result->recipients_count'
+            ) \
             .eq('workspace_id', workspace_id) \
             .order('started_at', desc=True) \
             .limit(limit) \
             .execute()
 
-        return result.data or []
+        # Match list_workspace_activities output (array length isn't selectable via PostgREST)
+        executions = result.data or []
+        for execution in executions:
+            execution['items_count'] = execution.get('items_count') or 0
+            execution['sources_count'] = len(execution.pop('sources', None) or [])
+            execution['recipients_count'] = execution.get('recipients_count') or 0
+
+        return executions
+
+    def get_workspace_activities_for_user(
+        self,
+        user_id: str,
+        workspace_id: str,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Get recent executions for the activity feed using database function.
+
+        Returns scalar counters (items_count, sources_count, recipients_count)
+        instead of the full scrape_result/send_result documents.
+
+        Args:
+            user_id: User ID requesting activities
+            workspace_id: Workspace ID to filter executions
+            limit: Maximum number of executions to return (default: 10)
+
+        Returns:
+            List of execution records with activity counters
+            (empty if user is not a workspace member)
+        """
+        try:
+            result = self.service_client.rpc('list_workspace_activities', {
+                'p_user_id': user_id,
+                'p_workspace_id': workspace_id,
+                'p_limit': limit
+            }).execute()
+
+            return result.data or []
+        except Exception:
+            # Fallback: membership check + table query
+            if not self.user_has_workspace_access(user_id, workspace_id):
+                return []
+            return self.get_workspace_recent_executions(workspace_id, limit=limit)
 
     # ========================================
     # TREND OPERATIONS
@@ -1400,6 +1720,36 @@ class SupabaseManager:
 
         return result.data[0]
 
+    def upsert_trends_bulk(self, trends_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Upsert many trends in a single request.
+
+        Same (workspace_id, topic) conflict key as upsert_trend, sent as one
+        array-body upsert so PostgREST runs a single batched statement.
+
+        Args:
+            trends_data: List of trend data (each must include workspace_id and topic)
+
+        Returns:
+            Upserted trend rows
+
+        Raises:
+            ValueError: If any trend is missing workspace_id or topic
+        """
+        if not trends_data:
+            return []
+
+        for trend_data in trends_data:
+            if 'workspace_id' not in trend_data or 'topic' not in trend_data:
+                raise ValueError("workspace_id and topic are required for upsert")
+
+        result = self.service_client.table('trends').upsert(
+            trends_data,
+            on_conflict='workspace_id,topic'
+        ).execute()
+
+        return result.data or []
+
     def get_trend(self, trend_id: str) -> Optional[Dict[str, Any]]:
         """Get trend by ID."""
         result = self.service_client.table('trends') \
@@ -1673,6 +2023,45 @@ class SupabaseManager:
         result = query.execute()
         return result.data
 
+    def count_content_items(
+        self,
+        workspace_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        sources: Optional[List[str]] = None
+    ) -> int:
+        """
+        Count content items without fetching them.
+
+        Same filters as list_content_items, but asks PostgREST for an exact
+        count and transfers at most one id column row.
+
+        Args:
+            workspace_id: Workspace ID
+            start_date: Filter by created_at >= start_date
+            end_date: Filter by created_at < end_date
+            sources: Filter by sources
+
+        Returns:
+            Number of matching content items
+        """
+        query = self.service_client.table('content_items') \
+            .select('id', count='exact') \
+            .eq('workspace_id', workspace_id) \
+            .limit(1)
+
+        if start_date:
+            query = query.gte('created_at', start_date.isoformat())
+
+        if end_date:
+            query = query.lt('created_at', end_date.isoformat())
+
+        if sources:
+            query = query.in_('source', sources)
+
+        result = query.execute()
+        return result.count or 0
+
     # ========================================
     # FEEDBACK OPERATIONS
     # ========================================